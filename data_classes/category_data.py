@@ -10,10 +10,12 @@ class CategoryData:
     Class that encompasses the scraped data for a given category during a scraper execution.
     """
 
+    __slots__ = ('category_id', 'name', 'url')
+
     def __init__(self, category_id, name, url):
         self.category_id = category_id
         self.name = name
         self.url = url
 
     def __repr__(self):
-        return str(vars(self))
+        return "CategoryData(category_id={!r}, name={!r}, url={!r})".format(self.category_id, self.name, self.url)
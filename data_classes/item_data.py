@@ -6,7 +6,8 @@ File that contains the ItemData class that encompasses the scraped data for a gi
 from datetime import datetime
 
 from data_classes.category_data import CategoryData
-from data_classes.price_data import PriceData
+from data_classes.price_data import PriceData, currency_name
+from data_classes.review_data import ReviewData
 
 
 class ItemData:
@@ -15,6 +16,10 @@ class ItemData:
     as price_history, which has the historical records for all scraped prices for the given item.
     """
 
+    __slots__ = ('item_id', 'item_name', 'item_url', 'timestamp', 'main_category', 'middle_category',
+                 'granular_category', 'item_description', 'item_brand', 'item_rating', 'customer_reviews_count',
+                 'customer_answer_count', 'price_history', 'reviews')
+
     def __init__(self, item_id: str, item_name: str, item_url: str, timestamp: datetime, main_category: CategoryData,
                  middle_category: CategoryData, granular_category: CategoryData,
                  item_description: str, item_brand: str, item_rating: float, customer_reviews_count: int,
@@ -36,6 +41,50 @@ class ItemData:
         self.price_history = price_history
         self.reviews = reviews
 
+    @classmethod
+    def from_dict(cls, item_data: dict):
+        """
+        Builds an ItemData object straight from a scraped item dictionary, including its categories, reviews
+        and the first price record.
+        :param item_data: A dictionary with the scraped data for a single item.
+        :return: An ItemData object with the corresponding values.
+        """
+        g = item_data.get
+        timestamp = g('timestamp')
+
+        main_category = CategoryData(g('main_category_id'), g('main_category_name'), g('main_category_url'))
+        middle_category = CategoryData(g('middle_category_id'), g('middle_category_name'), g('middle_category_url'))
+
+        # If for some reason there's only 2 nested categories instead of 3, granular and middle will be the same.
+        # The fallback is resolved before construction so no throwaway CategoryData is built.
+        granular_category_id = g('granular_category_id')
+        if granular_category_id:
+            granular_category = CategoryData(granular_category_id, g('granular_category_name'),
+                                             g('granular_category_url'))
+        else:
+            granular_category = middle_category if middle_category.category_id else main_category
+
+        raw_reviews = g('reviews')
+        if raw_reviews:
+            reviews = [ReviewData.from_dict(review) for review in raw_reviews]
+        else:
+            reviews = None
+
+        price = g('price')
+        currency_type = g('currency_type')
+        # The history stays empty rather than holding a None placeholder, so consumers can rely on
+        # every entry being a PriceData.
+        price_history = []
+        if price and currency_type and timestamp:
+            price_history.append(PriceData(price,
+                                           currency_name(currency_type),
+                                           timestamp,
+                                           g('discount_percentage')))
+
+        return cls(g('item_id'), g('item_name'), g('item_url'), timestamp, main_category, middle_category,
+                   granular_category, g('description'), g('brand'), g('rating'), g('customer_reviews_count'),
+                   g('customer_answer_count'), price_history, reviews)
+
     def append_new_price(self, price: PriceData):
         """
         Adds a new price to the item's price history.
@@ -45,7 +94,10 @@ class ItemData:
 
     def __repr__(self):
         """
-        Returns the string representation of the values within the class.
-        :return: Returns the string representation of the values within the class.
+        Returns a compact string representation of the item. price_history and reviews can be large,
+        so only their sizes are included; this keeps DEBUG-level logging of items cheap.
+        :return: The string representation of the item.
         """
-        return str(vars(self))
+        return "ItemData(item_id={!r}, item_name={!r}, granular_category={!r}, prices={}, reviews={})".format(
+            self.item_id, self.item_name, self.granular_category,
+            len(self.price_history), len(self.reviews) if self.reviews else 0)
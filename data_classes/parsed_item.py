@@ -0,0 +1,47 @@
+"""
+Author: Juan Amari, François Oren Chikli
+
+File that contains the ParsedItem class, the compact container for the raw fields scraped off a product page.
+"""
+from dataclasses import dataclass, fields
+from datetime import datetime
+
+
+@dataclass(slots=True)
+class ParsedItem:
+    """
+    Holds the raw scraped fields of a product page before DataParser turns them into an ItemData.
+    A slotted dataclass instead of a plain dict: at scrape scale the per-dict overhead of millions
+    of small dicts dominates memory, while slots store each field at a fixed offset.
+    """
+
+    timestamp: datetime = None
+    item_id: str = None
+    item_name: str = None
+    item_url: str = None
+    main_category_id: str = None
+    main_category_name: str = None
+    main_category_url: str = None
+    middle_category_id: str = None
+    middle_category_name: str = None
+    middle_category_url: str = None
+    granular_category_id: str = None
+    granular_category_name: str = None
+    granular_category_url: str = None
+    description: str = None
+    brand: str = None
+    rating: str = None
+    customer_reviews_count: str = None
+    customer_answer_count: str = None
+    price: float = None
+    currency_type: str = None
+    discount: str = None
+    reviews: list = None
+
+    def as_dict(self):
+        """
+        Returns the item's fields as a plain dictionary for callers that serialize the item or still
+        expect the old dict form.
+        :return: A dictionary mapping each field name to its value.
+        """
+        return {item_field.name: getattr(self, item_field.name) for item_field in fields(self)}
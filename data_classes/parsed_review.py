@@ -0,0 +1,33 @@
+"""
+Author: Juan Amari, François Oren Chikli
+
+File that contains the ParsedReview class, the compact container for the raw fields scraped off a review element.
+"""
+from dataclasses import dataclass, fields
+from datetime import datetime
+
+
+@dataclass(slots=True)
+class ParsedReview:
+    """
+    Holds the raw scraped fields of a single review before DataParser turns them into a ReviewData.
+    The review counterpart of ParsedItem: items carry dozens to thousands of reviews each, so the
+    per-dict overhead adds up even faster here than for items.
+    """
+
+    user_name: str = None
+    user_id: str = None
+    review_title: str = None
+    review_rating: str = None
+    review_attributes: str = None
+    review_text: str = None
+    post_timestamp: datetime = None
+    item_id: str = None
+
+    def as_dict(self):
+        """
+        Returns the review's fields as a plain dictionary for callers that serialize the review or
+        still expect the old dict form.
+        :return: A dictionary mapping each field name to its value.
+        """
+        return {review_field.name: getattr(self, review_field.name) for review_field in fields(self)}
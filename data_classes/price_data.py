@@ -4,12 +4,41 @@ Author: Juan Amari, François Oren Chikli
 File that contains the PriceData class that encompasses the scraped data for a given price during a scraper execution.
 """
 
+# Map that transforms a currency literal into its proper name.
+CURRENCY_TYPES = {'₪': 'NIS', '$': 'USD', '£': 'GBP', 'C$': 'CAD', 'HK$': 'HDK', "円": "JPY", "R$": "BRL",
+                  "DKr.": "DKK", "MXN$": "MXN", "Rp": "IDR", "€": "EUR", "AU$": "AUD", "CHF": "CHF",
+                  "NZ$": "NZD", "руб.": "RUB", "NKr.": "NOK", "SKr": "SEK", "Col$": "COP", "฿": "TBH", "zł": "PLN",
+                  "Ft": "HUF", "RM": "MYR", "lei": "RON", "₴": "UAH", "NT$": "TWD", "РСД": "RSD", "лв.": "BGN",
+                  "¥": "CNY", "Kn": "HRK", "د.إ": "AED", "₩": "KRW", "ARS$": "ARS", "TL": "TRY", "₦": "NGN",
+                  "R": "ZAR",
+                  "S$": "SGD", "ر.س": "SAR", "PHP": "PHP", "CL$": "CLP", "Kč": "CZK", "Rs": "INR", "د.م.": "MAD",
+                  "S/.": "PEN"}
+
+# The map split by symbol length: most scraped prices carry a single-character symbol ('$', '€', '¥', ...),
+# and the one-character dict is small enough to stay fully cache-resident.
+_SINGLE_CHAR_CURRENCIES = {symbol: name for symbol, name in CURRENCY_TYPES.items() if len(symbol) == 1}
+_MULTI_CHAR_CURRENCIES = {symbol: name for symbol, name in CURRENCY_TYPES.items() if len(symbol) > 1}
+
+
+def currency_name(symbol):
+    """
+    Resolves a currency symbol to its proper name, dispatching on symbol length so the common
+    single-character case only ever hashes one-character strings.
+    :param symbol: The currency symbol scraped from a price.
+    :return: The currency name, or None if the symbol is unknown.
+    """
+    if len(symbol) == 1:
+        return _SINGLE_CHAR_CURRENCIES.get(symbol)
+    return _MULTI_CHAR_CURRENCIES.get(symbol)
+
 
 class PriceData:
     """
     Class that encompasses the scraped data for a given price during a scraper execution
     """
 
+    __slots__ = ('price', 'currency_type', 'scraped_timestamp', 'discount')
+
     def __init__(self, price, currency_type, scraped_timestamp, discount):
         self.price = price
         self.currency_type = currency_type
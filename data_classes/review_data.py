@@ -3,6 +3,7 @@ Author: Juan Amari, François Oren Chikli
 
 File that contains the ReviewData class that encompasses the scraped data for a given review.
 """
+from data_classes.parsed_review import ParsedReview
 
 
 class ReviewData:
@@ -10,6 +11,9 @@ class ReviewData:
     Class that encompasses the scraped data for a given review.
     """
 
+    __slots__ = ('user_name', 'user_id', 'review_title', 'review_rating', 'review_attributes', 'review_text',
+                 'post_timestamp', 'item_id')
+
     def __init__(self, user_name, user_id, review_title, review_rating, review_attributes, review_text, post_timestamp,
                  item_id):
         self.user_name = user_name
@@ -20,3 +24,17 @@ class ReviewData:
         self.review_text = review_text
         self.post_timestamp = post_timestamp
         self.item_id = item_id
+
+    @classmethod
+    def from_dict(cls, review_data):
+        """
+        Builds a ReviewData object straight from a scraped review, either a ParsedReview or the
+        older dictionary form.
+        :param review_data: A ParsedReview or dictionary with the scraped data for a single review.
+        :return: A ReviewData object with the corresponding values.
+        """
+        if isinstance(review_data, ParsedReview):
+            review_data = review_data.as_dict()
+        g = review_data.get
+        return cls(g('user_name'), g('user_id'), g('review_title'), g('review_rating'), g('review_attributes'),
+                   g('review_text'), g('post_timestamp'), g('item_id'))
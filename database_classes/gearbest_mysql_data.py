@@ -73,6 +73,7 @@ CREATE TABLE IF NOT EXISTS `prices` (
 `discount_percentage` float,
 `item_id` varchar(50) NOT NULL,
 PRIMARY KEY (`price_id`),
+INDEX `idx_prices_item` (`item_id`),
 FOREIGN KEY (`item_id`) REFERENCES items(`item_id`)
 ) ENGINE=InnoDB
 """
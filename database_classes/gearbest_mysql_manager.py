@@ -6,6 +6,26 @@ from mysql import connector
 
 from database_classes.gearbest_mysql_data import *
 
+POOL_NAME = "gearbest_pool"
+POOL_SIZE = 8
+
+# Pool of persistent connections shared by every manager instance. It's created lazily on first use
+# so importing this module doesn't require a running MySQL server.
+_pool = None
+
+
+def _get_pool():
+    """
+    Returns the shared connection pool, creating it on first use.
+    :return: A MySQLConnectionPool bound to the gearbest database.
+    """
+    global _pool
+    if _pool is None:
+        _pool = connector.pooling.MySQLConnectionPool(pool_name=POOL_NAME, pool_size=POOL_SIZE,
+                                                      user=MYSQL_USER, password=MYSQL_PASSWORD,
+                                                      host=MYSQL_HOST, database=DB_NAME)
+    return _pool
+
 
 class GearbestMySQLManager:
     """
@@ -21,19 +41,35 @@ class GearbestMySQLManager:
 
     def __enter__(self):
         """
-        Enter method for the context manager. It creates the database if it doesn't exist.
+        Enter method for the context manager. Connections to the gearbest database are acquired from a shared
+        pool of persistent connections, so entering the context skips the TCP and auth handshake entirely.
         """
         if self.database:
-            self.cnx = connector.connect(user=MYSQL_USER, password=MYSQL_PASSWORD, host=MYSQL_HOST, database=DB_NAME)
+            self.cnx = _get_pool().get_connection()
         else:
             self.cnx = connector.connect(user=MYSQL_USER, password=MYSQL_PASSWORD, host=MYSQL_HOST)
-        self.cur = self.cnx.cursor(dictionary=True)
+        # Plain tuple cursor for writes and DDL; dictionary cursors are only created for SELECTs
+        # that actually consume named columns, saving a dict allocation per fetched row elsewhere.
+        self.cur = self.cnx.cursor()
+        # One server-side prepared cursor per distinct write statement, created on first use.
+        self._prepared_cursors = {}
+        self._selection_cursors = []
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """
-        Exit method for the context manager. It closes connections and cursors.
+        Exit method for the context manager. It commits the transaction if the block finished cleanly and rolls it
+        back otherwise, then closes the cursor and releases the connection, which for pooled connections returns it
+        to the pool instead of tearing it down.
         """
+        if exc_type is None:
+            self.cnx.commit()
+        else:
+            self.cnx.rollback()
+        for prepared_cursor in self._prepared_cursors.values():
+            prepared_cursor.close()
+        for selection_cursor in self._selection_cursors:
+            selection_cursor.close()
         self.cur.close()
         self.cnx.close()
 
@@ -41,8 +77,7 @@ class GearbestMySQLManager:
         """
         Creates all gearbest database tables if they don't exist.
         """
-        for table_name in TABLES:
-            table_description = TABLES[table_name]
+        for table_description in TABLES.values():
             self.cur.execute(table_description)
 
     def create_table(self, table_query):
@@ -55,21 +90,74 @@ class GearbestMySQLManager:
         self.cur.execute("CREATE DATABASE IF NOT EXISTS %s DEFAULT CHARACTER SET 'utf8'" % DB_NAME)
         self.cur.execute("USE %s" % DB_NAME)
 
+    def _prepared_cursor(self, query):
+        """
+        Returns a prepared-statement cursor for the given query, preparing it server-side only on first use.
+        Subsequent executes of the same statement send parameters alone instead of the full SQL text.
+        :param query: The query to prepare.
+        :return: A cursor with the statement prepared.
+        """
+        cursor = self._prepared_cursors.get(query)
+        if cursor is None:
+            cursor = self.cnx.cursor(prepared=True)
+            self._prepared_cursors[query] = cursor
+        return cursor
+
     def execute_manipulation_query(self, query, params=None):
         """
-        Executes a manipulation query that usually doesn't return anything.
+        Executes a manipulation query that usually doesn't return anything. The statement becomes part of the
+        context's transaction, which is committed once on exit instead of after every statement. Writes go
+        through a prepared cursor so repeated statements are parsed by the server only once.
         :param query: The query itself.
         :param params: The parameters for the query.
         """
-        self.cur.execute(query, params)
+        self._prepared_cursor(query).execute(query, params)
+
+    def execute_many_manipulation_query(self, query, seq_params):
+        """
+        Executes a manipulation query once for every parameter sequence in seq_params as a single batch within
+        the context's transaction. This saves one round-trip per row compared to execute_manipulation_query.
+        The batch goes through the plain cursor on purpose: its executemany rewrites INSERT ... VALUES into
+        one multi-row statement, while a prepared cursor's executemany just calls execute per row.
+        :param query: The query itself.
+        :param seq_params: A sequence of parameter sequences, one per row.
+        """
+        self.cur.executemany(query, seq_params)
+
+    def commit(self):
+        """
+        Commits the transaction mid-context, making the work so far durable. Long-running writers
+        call this after each flushed batch instead of leaning on the single commit at exit.
+        """
         self.cnx.commit()
 
+    def dict_cursor(self):
+        """
+        Returns a fresh dictionary cursor for selections that consume named columns. The cursor is
+        closed along with the context, or earlier through release_selection_cursor.
+        :return: A dictionary cursor on this context's connection.
+        """
+        cursor = self.cnx.cursor(dictionary=True)
+        self._selection_cursors.append(cursor)
+        return cursor
+
+    def release_selection_cursor(self, cursor):
+        """
+        Closes a selection cursor and drops it from the context's cleanup list. Callers on a
+        long-lived manager release their cursors this way, so the list doesn't accumulate one
+        closed cursor per query for the manager's whole lifetime.
+        :param cursor: A cursor previously returned by dict_cursor or execute_selection_query.
+        """
+        cursor.close()
+        self._selection_cursors.remove(cursor)
+
     def execute_selection_query(self, query, params=None):
         """
         Executes a selection query and returns the cursor with the reuslts.
         :param query: The query itself.
         :param params: The parameters for the query.
-        :return: The cursor containing the results.
+        :return: The cursor containing the results, with rows as dictionaries.
         """
-        self.cur.execute(query, params)
-        return self.cur
+        cursor = self.dict_cursor()
+        cursor.execute(query, params)
+        return cursor
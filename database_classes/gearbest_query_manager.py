@@ -4,7 +4,6 @@ File that manages the queries that go into the Gearbest Scraping database.
 """
 
 from data_classes.item_data import ItemData
-from data_classes.price_data import PriceData
 from database_classes.gearbest_mysql_manager import GearbestMySQLManager
 
 # These are basic queries
@@ -47,11 +46,15 @@ VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
 INSERT_INTO_CHILD_CATEGORY = """
 INSERT IGNORE INTO * (category_id,
                category_name,
-               category_url, 
+               category_url,
                parent_category_id)
 VALUES (%s, %s, %s, %s)
 """
 
+# Materialized once at import so the hot insert path doesn't re-run str.replace per item.
+INSERT_INTO_MIDDLE_CATEGORY = INSERT_INTO_CHILD_CATEGORY.replace("*", "middle_categories")
+INSERT_INTO_GRANULAR_CATEGORY = INSERT_INTO_CHILD_CATEGORY.replace("*", "granular_categories")
+
 INSERT_INTO_MAIN_CATEGORY = """
 INSERT IGNORE INTO main_categories (category_id,
                        category_name,
@@ -70,112 +73,203 @@ class GearbestQueryManager:
     Class that manages the queries into the gearbest MySQL database.
     """
 
+    # Category ids already committed by this process. Categories recur across thousands of items, so these
+    # sets turn the almost-always-ignored INSERT IGNOREs into a set lookup. INSERT IGNORE stays as the
+    # safety net for ids first inserted by another process. Ids inserted inside a still-open transaction
+    # are tracked separately (see _new_pending_categories) and merged here only after the commit, since a
+    # rollback would otherwise leave its category rows permanently marked as seen.
+    _seen_main_categories = set()
+    _seen_middle_categories = set()
+    _seen_granular_categories = set()
+
+    @staticmethod
+    def _new_pending_categories():
+        """
+        Returns a fresh accumulator for the category ids inserted during one transaction, keyed per
+        hierarchy level like the seen-sets.
+        :return: A dictionary with an empty id set per category level.
+        """
+        return {"main": set(), "middle": set(), "granular": set()}
+
+    @staticmethod
+    def _commit_pending_categories(pending_categories):
+        """
+        Merges the category ids inserted by a now-committed transaction into the seen-sets.
+        :param pending_categories: The accumulator filled by add_categories_from_item.
+        """
+        GearbestQueryManager._seen_main_categories.update(pending_categories["main"])
+        GearbestQueryManager._seen_middle_categories.update(pending_categories["middle"])
+        GearbestQueryManager._seen_granular_categories.update(pending_categories["granular"])
+
     @staticmethod
     def add_product(item_data: ItemData):
         """
         This is the most complex query. It needs to add everything else first.
-        Order is very important.
+        Order is very important. A single connection is shared by every helper so each item
+        costs one MySQL handshake instead of five.
         :param item_data: An ItemData object.
         """
-        GearbestQueryManager.add_categories_from_item(item_data)
-        GearbestQueryManager.add_item(item_data)
-        GearbestQueryManager.add_item_cat_relationship(item_data)
-        GearbestQueryManager.add_price_from_item(item_data)
-        GearbestQueryManager.add_reviews_from_item(item_data)
+        pending_categories = GearbestQueryManager._new_pending_categories()
+        with GearbestMySQLManager(DATABASE_NAME) as sql_mgr:
+            GearbestQueryManager.add_categories_from_item(sql_mgr, item_data, pending_categories)
+            GearbestQueryManager.add_item(sql_mgr, item_data)
+            GearbestQueryManager.add_item_cat_relationship(sql_mgr, item_data)
+            GearbestQueryManager.add_price_from_item(sql_mgr, item_data)
+            GearbestQueryManager.add_reviews_from_item(sql_mgr, item_data)
+        GearbestQueryManager._commit_pending_categories(pending_categories)
 
     @staticmethod
-    def add_item(item_data: ItemData):
+    def add_products_bulk(item_data_batch: list):
+        """
+        Inserts a whole batch of items over one connection and one transaction. The parameter rows of
+        every item are gathered first, then items, category relationships, prices and reviews each go
+        in as a single executemany, so the batch pays one commit instead of one per item. Categories
+        still run through the per-item helper, which the seen-sets make a near no-op.
+        :param item_data_batch: A list of ItemData objects.
+        """
+        if not item_data_batch:
+            return
+        pending_categories = GearbestQueryManager._new_pending_categories()
         with GearbestMySQLManager(DATABASE_NAME) as sql_mgr:
-            sql_mgr.execute_manipulation_query(INSERT_ITEM_QUERY, [
-                item_data.item_id,
-                item_data.item_name,
-                item_data.item_url,
-                item_data.timestamp,
-                item_data.granular_category.category_id,
-                item_data.item_description,
-                item_data.item_brand,
-                item_data.item_rating,
-                item_data.customer_reviews_count,
-                item_data.customer_answer_count
-            ])
+            item_params = []
+            relationship_params = []
+            price_params = []
+            review_params = []
+            for item_data in item_data_batch:
+                GearbestQueryManager.add_categories_from_item(sql_mgr, item_data, pending_categories)
+                item_params.append((item_data.item_id,
+                                    item_data.item_name,
+                                    item_data.item_url,
+                                    item_data.timestamp,
+                                    item_data.granular_category.category_id,
+                                    item_data.item_description,
+                                    item_data.item_brand,
+                                    item_data.item_rating,
+                                    item_data.customer_reviews_count,
+                                    item_data.customer_answer_count))
+                relationship_params.append((item_data.item_id, item_data.granular_category.category_id))
+                price_params.extend((price.price,
+                                     price.currency_type,
+                                     price.scraped_timestamp,
+                                     price.discount,
+                                     item_data.item_id) for price in item_data.price_history)
+                if item_data.reviews:
+                    review_params.extend((review.user_id,
+                                          review.user_name,
+                                          review.review_title,
+                                          review.review_rating,
+                                          review.review_attributes,
+                                          review.review_text,
+                                          review.post_timestamp,
+                                          item_data.item_id) for review in item_data.reviews)
+
+            sql_mgr.execute_many_manipulation_query(INSERT_ITEM_QUERY, item_params)
+            sql_mgr.execute_many_manipulation_query(INSERT_INTO_ITEM_TO_CAT, relationship_params)
+            if price_params:
+                sql_mgr.execute_many_manipulation_query(INSERT_PRICE_QUERY, price_params)
+            if review_params:
+                sql_mgr.execute_many_manipulation_query(INSERT_REVIEW_QUERY, review_params)
+        GearbestQueryManager._commit_pending_categories(pending_categories)
 
     @staticmethod
-    def add_categories_from_item(item_data: ItemData):
+    def add_item(sql_mgr: GearbestMySQLManager, item_data: ItemData):
+        sql_mgr.execute_manipulation_query(INSERT_ITEM_QUERY, [
+            item_data.item_id,
+            item_data.item_name,
+            item_data.item_url,
+            item_data.timestamp,
+            item_data.granular_category.category_id,
+            item_data.item_description,
+            item_data.item_brand,
+            item_data.item_rating,
+            item_data.customer_reviews_count,
+            item_data.customer_answer_count
+        ])
+
+    @staticmethod
+    def add_categories_from_item(sql_mgr: GearbestMySQLManager, item_data: ItemData, pending_categories):
         """
         Fetches the categories from Item Data and inserts them into the granular_categories, middle_categories and
-        main_categories tables.
+        main_categories tables. Inserted ids are recorded in pending_categories, not the seen-sets: the caller
+        merges them (via _commit_pending_categories) only once its transaction commits, so a rollback doesn't
+        leave its categories marked as seen.
+        :param sql_mgr: An already-open GearbestMySQLManager to run the queries through.
         :param item_data: An ItemData object that contains the required data to insert.
+        :param pending_categories: The transaction's accumulator from _new_pending_categories.
         """
         main_cat = item_data.main_category
         middle_cat = item_data.middle_category
         granular_cat = item_data.granular_category
 
-        with GearbestMySQLManager(DATABASE_NAME) as sql_mgr:
-            if main_cat:
-                sql_mgr.execute_manipulation_query(INSERT_INTO_MAIN_CATEGORY, [main_cat.category_id,
-                                                                               main_cat.name,
-                                                                               main_cat.url])
-
-            if middle_cat:
-                sql_mgr.execute_manipulation_query(INSERT_INTO_CHILD_CATEGORY.replace("*", "middle_categories"),
-                                                   [middle_cat.category_id,
-                                                    middle_cat.name,
-                                                    middle_cat.url,
-                                                    main_cat.category_id])
-
-            sql_mgr.execute_manipulation_query(INSERT_INTO_CHILD_CATEGORY.replace("*", "granular_categories"),
+        if main_cat and main_cat.category_id not in GearbestQueryManager._seen_main_categories \
+                and main_cat.category_id not in pending_categories["main"]:
+            sql_mgr.execute_manipulation_query(INSERT_INTO_MAIN_CATEGORY, [main_cat.category_id,
+                                                                           main_cat.name,
+                                                                           main_cat.url])
+            pending_categories["main"].add(main_cat.category_id)
+
+        if middle_cat and middle_cat.category_id not in GearbestQueryManager._seen_middle_categories \
+                and middle_cat.category_id not in pending_categories["middle"]:
+            sql_mgr.execute_manipulation_query(INSERT_INTO_MIDDLE_CATEGORY,
+                                               [middle_cat.category_id,
+                                                middle_cat.name,
+                                                middle_cat.url,
+                                                main_cat.category_id])
+            pending_categories["middle"].add(middle_cat.category_id)
+
+        if granular_cat.category_id not in GearbestQueryManager._seen_granular_categories \
+                and granular_cat.category_id not in pending_categories["granular"]:
+            sql_mgr.execute_manipulation_query(INSERT_INTO_GRANULAR_CATEGORY,
                                                [granular_cat.category_id,
                                                 granular_cat.name,
                                                 granular_cat.url,
                                                 middle_cat.category_id])
+            pending_categories["granular"].add(granular_cat.category_id)
 
     @staticmethod
-    def add_price_from_item(item_data: ItemData):
+    def add_price_from_item(sql_mgr: GearbestMySQLManager, item_data: ItemData):
         """
         Adds a price to the price history of an item from the given data.
+        :param sql_mgr: An already-open GearbestMySQLManager to run the queries through.
         :param item_data: ItemData object that contains the scraped data.
         """
-        price_history = item_data.price_history
-        for price in price_history:
-            if not isinstance(price, PriceData):
-                continue
-            with GearbestMySQLManager(DATABASE_NAME) as sql_mgr:
-                sql_mgr.execute_manipulation_query(INSERT_PRICE_QUERY, [price.price,
-                                                                        price.currency_type,
-                                                                        price.scraped_timestamp,
-                                                                        price.discount,
-                                                                        item_data.item_id
-                                                                        ])
+        params = [(price.price,
+                   price.currency_type,
+                   price.scraped_timestamp,
+                   price.discount,
+                   item_data.item_id) for price in item_data.price_history]
+        if not params:
+            return
+        sql_mgr.execute_many_manipulation_query(INSERT_PRICE_QUERY, params)
 
     @staticmethod
-    def add_reviews_from_item(item_data: ItemData):
+    def add_reviews_from_item(sql_mgr: GearbestMySQLManager, item_data: ItemData):
         """
         Manages the addition of reviews into the reviews table within the Gearbest database. Reviews are contained within
         and ItemData object.
+        :param sql_mgr: An already-open GearbestMySQLManager to run the queries through.
         :param item_data: The given ItemData object.
         """
         reviews = item_data.reviews
         if not reviews:
             return
-        with GearbestMySQLManager(DATABASE_NAME) as sql_mgr:
-            for review in reviews:
-                sql_mgr.execute_manipulation_query(INSERT_REVIEW_QUERY,
-                                                   [review.user_id,
-                                                    review.user_name,
-                                                    review.review_title,
-                                                    review.review_rating,
-                                                    review.review_attributes,
-                                                    review.review_text,
-                                                    review.post_timestamp,
-                                                    item_data.item_id])
+        params = [(review.user_id,
+                   review.user_name,
+                   review.review_title,
+                   review.review_rating,
+                   review.review_attributes,
+                   review.review_text,
+                   review.post_timestamp,
+                   item_data.item_id) for review in reviews]
+        sql_mgr.execute_many_manipulation_query(INSERT_REVIEW_QUERY, params)
 
     @staticmethod
-    def add_item_cat_relationship(item_data: ItemData):
+    def add_item_cat_relationship(sql_mgr: GearbestMySQLManager, item_data: ItemData):
         """
         Since Items can belong to many categories and many categories can belong to an item, this method manages
         the weak entity table that encompasses this relationship. It feeds off ItemData an ItemData object.
+        :param sql_mgr: An already-open GearbestMySQLManager to run the queries through.
         :param item_data: The given ItemData object that contains the scraped elements for that specific item.
         """
-        with GearbestMySQLManager(DATABASE_NAME) as sql_mgr:
-            sql_mgr.execute_manipulation_query(INSERT_INTO_ITEM_TO_CAT,
-                                               [item_data.item_id, item_data.granular_category.category_id])
+        sql_mgr.execute_manipulation_query(INSERT_INTO_ITEM_TO_CAT,
+                                           [item_data.item_id, item_data.granular_category.category_id])
@@ -6,6 +6,7 @@ Main class for Gearbest Enrichment
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from database_classes.gearbest_mysql_manager import GearbestMySQLManager
 from enrichment.errors.enrichment_error import EnrichmentError
@@ -13,6 +14,21 @@ from enrichment.language_enricher import LanguageEnricher
 
 logger = logging.getLogger("GearbestEnricher")
 
+# How many API requests can be in flight at once. The work is pure network I/O so the GIL is released
+# while waiting; the request rate itself is still paced to the allowed RPM.
+MAX_API_WORKERS = 8
+
+# How many detected languages to accumulate before flushing them to MySQL in one executemany batch.
+INSERTION_BATCH_SIZE = 500
+
+# How many rows fetchmany pulls off the wire per call while draining the selection.
+FETCH_CHUNK_SIZE = 1000
+
+# How many reviews are submitted to the API before their completions are handled. Each chunk's
+# results are processed (and flushed once a batch fills) before the next chunk is paced out, so
+# inserts and commits happen throughout a long run instead of only at its very end.
+SUBMISSION_CHUNK_SIZE = 100
+
 REVIEW_TABLE_QUERY = """
 CREATE TABLE IF NOT EXISTS `review_languages` (
 `id` int NOT NULL AUTO_INCREMENT,
@@ -20,12 +36,17 @@ CREATE TABLE IF NOT EXISTS `review_languages` (
 `detected_language` varchar(50) DEFAULT NULL,
 `certainty_percentage` int DEFAULT NULL,
 PRIMARY KEY (`id`),
+INDEX `idx_rl_review_id` (`review_id`),
 FOREIGN KEY(`review_id`) REFERENCES reviews(`id`)
 ) ENGINE=InnoDB
 """
 
+# LEFT JOIN / IS NULL anti-join instead of NOT IN (subquery): MySQL optimizes the former far better,
+# and it walks idx_rl_review_id instead of rescanning review_languages per row.
 SELECT_REVIEWS_QUERY = """
-SELECT id, review_text from `reviews` WHERE `id` NOT IN (SELECT `review_id` FROM `review_languages`) LIMIT %s;
+SELECT r.id, r.review_text FROM `reviews` r
+LEFT JOIN `review_languages` rl ON rl.review_id = r.id
+WHERE rl.review_id IS NULL LIMIT %s;
 """
 
 INSERTION_QUERY = """
@@ -45,34 +66,95 @@ class GearbestEnricher:
         self.database = database
         self.max_rows = max_rows
         self.allowed_rpm = rpm
+        # Seconds between requests at the allowed RPM; submission times are tracked against the
+        # monotonic clock so API latency counts toward the interval instead of on top of it.
+        self.request_interval = 60.0 / rpm
+        self._next_request_time = 0.0
         self.create_review_language_table()
 
+    def _wait_for_request_slot(self):
+        """
+        Blocks until the next API request is allowed under the configured RPM.
+        """
+        delay = self._next_request_time - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        self._next_request_time = time.monotonic() + self.request_interval
+
     def update_languages(self, api_key):
         """
         Goes over the amount of rows defined by maxrows from the database and retrieves the language
-        for each review and inserts it into a new table.
+        for each review and inserts it into a new table. The selection is drained up front, and the
+        paced API phase then runs in chunks whose results are inserted and committed as the run
+        progresses, so a long paced run is durable as it goes.
         """
-        with GearbestMySQLManager(self.database) as mgr:
-            logger.info("Retrieving reviews...")
-            cur = mgr.execute_selection_query(SELECT_REVIEWS_QUERY, [self.max_rows])
-            reviews = cur.fetchall()
-            enricher = LanguageEnricher(api_key=api_key)
-            for review in reviews:
-                review_text = review["review_text"]
-                review_id = review["id"]
-                logger.info("Detecting Language for Review ID: {}".format(review_id))
-                try:
-                    results = enricher.get_language(review_text)
-                    detected_language, confidence = results["language_name"], results["confidence_percentage"]
-                    mgr.execute_manipulation_query(INSERTION_QUERY, [review_id, detected_language, confidence])
-                    logger.info("Language Detected for Review ID: {} is {}, with confidence {}".format(review_id,
-                                                                                                       detected_language,
-                                                                                                       confidence))
-                    # Sleep for however long to match the allowed RPM.
-                except EnrichmentError as err:
-                    logger.error("An error occured: {}".format(err))
-                finally:
-                    time.sleep(self.allowed_rpm / 59)
+        reviews = self._fetch_unenriched_reviews()
+        if not reviews:
+            logger.info("No reviews left to enrich.")
+            return
+
+        # Built before the MySQL context so an enricher-init failure never holds a pooled connection.
+        # The context closes the enricher's HTTP session once the run is done.
+        with LanguageEnricher(api_key=api_key) as enricher, GearbestMySQLManager(self.database) as mgr:
+            with ThreadPoolExecutor(max_workers=MAX_API_WORKERS) as executor:
+                # Requests fan out over the executor; submissions are paced to the allowed RPM so
+                # the pool bounds concurrency instead of the API round-trip bounding throughput.
+                # Chunking keeps completion handling interleaved with submission: each chunk's
+                # results are flushed before the next chunk is paced out, instead of every future
+                # being submitted (and the whole quota spent) before the first insert.
+                pending_rows = []
+                for chunk_start in range(0, len(reviews), SUBMISSION_CHUNK_SIZE):
+                    pending_futures = {}
+                    for review_id, review_text in reviews[chunk_start:chunk_start + SUBMISSION_CHUNK_SIZE]:
+                        logger.info("Detecting Language for Review ID: {}".format(review_id))
+                        self._wait_for_request_slot()
+                        pending_futures[executor.submit(enricher.get_language, review_text)] = review_id
+
+                    for future in as_completed(pending_futures):
+                        review_id = pending_futures[future]
+                        try:
+                            results = future.result()
+                            detected_language, confidence = results["language_name"], results["confidence_percentage"]
+                            pending_rows.append((review_id, detected_language, confidence))
+                            logger.info("Language Detected for Review ID: {} is {}, with confidence {}".format(
+                                review_id, detected_language, confidence))
+                        except EnrichmentError as err:
+                            logger.error("An error occured: {}".format(err))
+                        if len(pending_rows) >= INSERTION_BATCH_SIZE:
+                            self._flush_rows(mgr, pending_rows)
+                if pending_rows:
+                    self._flush_rows(mgr, pending_rows)
+
+    def _fetch_unenriched_reviews(self):
+        """
+        Drains the not-yet-enriched reviews off the wire promptly, in fetchmany chunks, within a
+        selection context of their own. Pacing the reads themselves would stall the server mid-result
+        until net_write_timeout kills the connection, so the paced API phase only starts once the
+        result set is fully read and the connection is back in the pool.
+        :return: A list of (review id, review text) tuples.
+        """
+        logger.info("Retrieving reviews...")
+        reviews = []
+        with GearbestMySQLManager(self.database) as select_mgr:
+            cur = select_mgr.execute_selection_query(SELECT_REVIEWS_QUERY, [self.max_rows])
+            while True:
+                chunk = cur.fetchmany(FETCH_CHUNK_SIZE)
+                if not chunk:
+                    break
+                reviews.extend((review["id"], review["review_text"]) for review in chunk)
+        return reviews
+
+    @staticmethod
+    def _flush_rows(mgr, pending_rows):
+        """
+        Writes the accumulated language rows in one batch, commits them so they are durable even if
+        the rest of the run dies, and empties the accumulator.
+        :param mgr: The already-open GearbestMySQLManager to write through.
+        :param pending_rows: The (review id, language, confidence) rows collected so far.
+        """
+        mgr.execute_many_manipulation_query(INSERTION_QUERY, pending_rows)
+        mgr.commit()
+        pending_rows.clear()
 
     def create_review_language_table(self):
         """
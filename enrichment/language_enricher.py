@@ -3,7 +3,13 @@ Authors: Juan Amari, François Oren Chikli
 Enrichment API class file.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import requests
+from cachecontrol.adapter import CacheControlAdapter
+from cachecontrol.caches.file_cache import FileCache
+from urllib3.util.retry import Retry
 
 import enrichment.language_enricher_secrets as secrets
 from enrichment.errors.enrichment_error import EnrichmentError
@@ -13,13 +19,56 @@ MAX_CHARS_DEFAULT = 100
 
 QUOTA_EXCEEDED_ERROR = 104
 
+# How many bulk API calls are kept in flight at once by get_languages.
+DEFAULT_CONCURRENCY = 8
+
+# On-disk HTTP cache for the API session. Repeat queries are answered with conditional requests
+# (ETag / If-None-Match), so a 304 costs no response body and no API quota.
+WEB_CACHE_DIR = ".web_cache"
+
+# Connect and read timeouts in seconds for every API call.
+REQUEST_TIMEOUT = (3, 10)
+
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+
+# How many distinct truncated queries to memoize in memory. Scraped titles and short reviews repeat
+# a lot once truncated, and every duplicate answered from the cache is an API call (and quota) saved.
+LANGUAGE_CACHE_SIZE = 8192
+
 
 class LanguageEnricher:
-    DEFAULT_TEMPLATE = "{}?access_key={}&query={}"
 
     def __init__(self, url=secrets.BASE_API_URL, api_key=secrets.API_KEY):
         self.url = url
         self.api_key = api_key
+        # One session for the enricher's lifetime: keep-alive reuses the TCP+TLS connection to the
+        # API host across calls instead of paying DNS + handshake per request. The caching adapter
+        # also honors ETags, so repeated queries revalidate with a bodyless 304.
+        self.session = requests.Session()
+        adapter = CacheControlAdapter(cache=FileCache(WEB_CACHE_DIR),
+                                      pool_connections=1, pool_maxsize=8,
+                                      max_retries=Retry(total=3, backoff_factor=0.2,
+                                                        status_forcelist=RETRYABLE_STATUSES))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Per-instance memoization of the network path, keyed on the truncated query. Wrapping here
+        # rather than decorating the method keeps self out of the cache key and lets the cache die
+        # with the enricher. Errors raise and are therefore never cached.
+        self._request_language_cached = lru_cache(maxsize=LANGUAGE_CACHE_SIZE)(self._request_language)
+
+    def __enter__(self):
+        """Context manager function, returns self once the scope is created."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager function, closes the HTTP session once out of scope."""
+        self.close()
+
+    def close(self):
+        """
+        Closes the underlying HTTP session and its pooled connections.
+        """
+        self.session.close()
 
     def get_language(self, input_string, max_chars=MAX_CHARS_DEFAULT):
         """
@@ -28,9 +77,19 @@ class LanguageEnricher:
         :param max_chars: Maximum amount of characters to send to the API.
         :return: The language if it has a meaningful probability.
         """
-        parsed_string = input_string[:max_chars]
-        assembled_url = self.assemble_url(parsed_string)
-        response = requests.get(assembled_url).json()
+        return self._request_language_cached(input_string[:max_chars])
+
+    def _request_language(self, parsed_string):
+        """
+        The uncached network path behind get_language; called once per distinct truncated query.
+        :param parsed_string: The already-truncated string to query for.
+        :return: The language if it has a meaningful probability.
+        """
+        # requests URL-encodes the params itself; review text regularly contains &, # and unicode,
+        # which a hand-formatted query string sent through to the API unescaped.
+        response = self.session.get(self.url,
+                                    params={'access_key': self.api_key, 'query': parsed_string},
+                                    timeout=REQUEST_TIMEOUT).json()
         first_result_index = 0
         if response["success"]:
             if response["results"]:
@@ -42,10 +101,16 @@ class LanguageEnricher:
         else:
             raise EnrichmentError("There was an error with this request: {}".format(str(response)))
 
-    def assemble_url(self, parsed_string):
+    def get_languages(self, input_strings, max_chars=MAX_CHARS_DEFAULT, concurrency=DEFAULT_CONCURRENCY):
         """
-        Assembles a URL from the base url, access key and the string.
-        :param parsed_string: The string to query for.
-        :return: The URL to query.
+        Retrieves the language for a batch of strings, pipelining the API calls over a small thread pool
+        that shares this enricher's session. N serial round-trips collapse into roughly N / concurrency.
+        The API only answers one query per request, so the calls are concurrent rather than a single
+        bulk request.
+        :param input_strings: The input strings to retrieve the languages from.
+        :param max_chars: Maximum amount of characters to send to the API per string.
+        :param concurrency: How many requests to keep in flight at once.
+        :return: A list of results aligned with the input strings; errors propagate when iterated.
         """
-        return LanguageEnricher.DEFAULT_TEMPLATE.format(self.url, self.api_key, parsed_string)
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(lambda input_string: self.get_language(input_string, max_chars), input_strings))
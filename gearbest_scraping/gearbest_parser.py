@@ -5,21 +5,94 @@ Main file for the parsing class for Gearbeast.
 import datetime
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 
+import lxml.html
 from bs4 import BeautifulSoup
 
+from data_classes.parsed_item import ParsedItem
+from data_classes.parsed_review import ParsedReview
 from gearbest_scraping.errors.parsing_error import ParsingError
 
 DIGIT_PATTERN = "[^0-9]"
-PAGE_PATTERN = ".+/[0-9].+\?.*"
+PAGE_PATTERN = r".+/[0-9].+\?.*"
 ID_PATTERN = "(pp|c)_.+?[/|.]"
+
+# Compiled once at import: these run several times per product and once per review, and the compiled
+# form skips the re-module cache lookup on every call.
+_DIGIT_RE = re.compile(DIGIT_PATTERN)
+_PAGE_RE = re.compile(PAGE_PATTERN)
+_ID_RE = re.compile(ID_PATTERN)
+_PRICE_DIGITS_RE = re.compile(r"[0-9.]+")
+_PRICE_CURRENCY_RE = re.compile(r"[^0-9.\s]+")
 PAGE_START_INDEX = 2
 CATEGORY_HIERARCHY = ["main_category", "middle_category", "granular_category"]
-REVIEW_DATE_FORMAT_BASIC = '%b %d,%Y'
-REVIEW_DATE_FORMAT_COMPLEX = '%b %d,%Y %H:%M:%S'
+# Every field parse_item needs from the item subtree is keyed by one of these unique class names,
+# which lets a single find_all sweep collect all of them in one traversal.
+ITEM_FIELD_CLASSES = ('goodsIntro_title', 'goodsIntro_summary', 'goodsIntro_brand', 'gbStarGrade_count',
+                      'goodsIntro_reviews', 'goodsIntro_faq', 'goodsIntro_price', 'goodsIntro_priceDiscount')
+# Review timestamps come in two shapes ("Jan 2,2018" and "Jan 2,2018 13:37:00"). One compiled regex
+# with an optional time group covers both, so the common path skips strptime's format interpreter
+# and the ValueError-driven second attempt it needed.
+_REVIEW_TIME_RE = re.compile(r"(?P<month>[A-Za-z]{3}) (?P<day>\d{1,2}),(?P<year>\d{4})"
+                             r"(?: (?P<hour>\d{2}):(?P<minute>\d{2}):(?P<second>\d{2}))?$")
+_MONTHS = {'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+           'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12}
 
 logger = logging.getLogger("GearbestLogger")
 
+_NEWLINE_TRANSLATION = str.maketrans("", "", "\n\r")
+
+
+def _clean(text, prefix=None):
+    """
+    Collapses the replace/replace/rstrip/strip chains used on scraped text into a single translate
+    pass plus one strip, dropping an optional label prefix such as "Brand:" first.
+    :param text: The scraped text to clean.
+    :param prefix: An optional prefix to remove before cleaning.
+    :return: The text without newlines or surrounding whitespace.
+    """
+    if prefix:
+        text = text.replace(prefix, "", 1)
+    return text.translate(_NEWLINE_TRANSLATION).strip()
+
+
+def _extract_category_id(href):
+    """
+    Pulls the pp_/c_ entity ID out of a category URL with plain string scanning. Category hrefs have
+    a fixed shape, so the C-coded str methods cover virtually all of them and the ID regex only runs
+    as a fallback; this executes three times per item across every item in a catalog.
+    :param href: The category URL to extract the ID from.
+    :return: The entity ID.
+    """
+    start = href.rfind('pp_')
+    if start == -1:
+        start = href.rfind('c_')
+    if start != -1:
+        end = len(href)
+        for terminator in ('/', '.'):
+            position = href.find(terminator, start)
+            if position != -1 and position < end:
+                end = position
+        return href[start:end]
+    return _ID_RE.search(href).group().strip("/")
+
+
+def _parse_review_time(time_text):
+    """
+    Parses a review timestamp string into a datetime. Unparseable strings are a normal occurrence in
+    scraped content, so a non-match returns None directly instead of raising and catching an exception
+    per malformed date.
+    :param time_text: The stripped timestamp text from a review.
+    :return: A datetime, or None if the text doesn't match a known format.
+    """
+    match = _REVIEW_TIME_RE.match(time_text)
+    month = _MONTHS.get(match['month']) if match else None
+    if not month:
+        return None
+    return datetime.datetime(int(match['year']), month, int(match['day']),
+                             int(match['hour'] or 0), int(match['minute'] or 0), int(match['second'] or 0))
+
 
 class GearbestParser:
     """
@@ -34,22 +107,24 @@ class GearbestParser:
         Parses a given string that contains both a floating point number representing the price and a currency type.
         :param input_price: The given string.
         :param default_locale: In case there's a problem parsing the price.
-        :return: A tuple containing the price and the currency type.
-        """
-        price = ""
-        currency = ""
-        for char in input_price:
-            if char == "." or char.isdigit():
-                price += char
-            else:
-                currency += char
-        if not currency:
+        :return: A tuple containing the price and the currency type, or (None, None) for empty input.
+        """
+        if not input_price:
+            return None, None
+        # Both scans run in the regex engine instead of a per-character Python loop; the currency
+        # pattern also skips whitespace, which the old loop misclassified as currency characters.
+        price_match = _PRICE_DIGITS_RE.search(input_price)
+        price = price_match.group() if price_match else ""
+        currency_match = _PRICE_CURRENCY_RE.search(input_price)
+        if currency_match:
+            currency = currency_match.group()
+        else:
             logger.debug("No currency found for this price, defaulting to USD.")
             currency = default_locale
         return price, currency
 
     @staticmethod
-    def parse_departments(department_content, parser='html.parser'):
+    def parse_departments(department_content, parser='lxml'):
         """
         Parses all departments from the given source content.
         :param department_content: The source content that contains the departments or catalogs.
@@ -76,86 +151,123 @@ class GearbestParser:
         return department_names_and_urls
 
     @staticmethod
-    def _parse_basic_element(element, parsing_func, item_dict, key_name):
+    def _parse_basic_element(element, parsing_func, parsed_item, key_name):
         """
-        Wrapper function for elements with simple parsing requirements. It mutates a given dictionary.
+        Wrapper function for elements with simple parsing requirements. It mutates a given ParsedItem.
         :param element: Element from BeautifulSoup.
         :param parsing_func: The function that handles the parsing.
-        :param item_dict: Reference to the dictionary that will be mutated in accordance to the given key_name.
-        :param key_name: Key to use for the element in the given dictionary that will be mutated.
+        :param parsed_item: Reference to the ParsedItem that will be mutated in accordance to the given key_name.
+        :param key_name: The field of the given ParsedItem that will be set.
         """
         if element:
             element_data = parsing_func(element)
-            item_dict[key_name] = element_data
+            setattr(parsed_item, key_name, element_data)
 
     @staticmethod
-    def _parse_item_url(element, item_dict):
+    def _parse_item_url(element, parsed_item):
         """
-        Wrapper function for the item_url element of Gearbest products. Mutates a given dictionary with the key.
+        Wrapper function for the item_url element of Gearbest products. Mutates a given ParsedItem.
         :param element: The element to parse.
-        :param item_dict: The dictionary to mutate.
+        :param parsed_item: The ParsedItem to mutate.
         """
         if element:
             item_url = element.get('href')
-            item_dict["item_url"] = item_url
-            item_dict["item_id"] = re.search(ID_PATTERN, item_url).group().rstrip(".")
+            parsed_item.item_url = item_url
+            parsed_item.item_id = _ID_RE.search(item_url).group().rstrip(".")
 
     @staticmethod
-    def _parse_categories(categories, item_dict):
+    def _parse_categories(categories, parsed_item):
         """
-        Parses the category elements from a given list full of those elements. Mutates a dictionary accordingly, using
-        a pre-defined category hierarchy for the element names.
+        Parses the category elements from a given list full of those elements. Mutates a ParsedItem accordingly, using
+        a pre-defined category hierarchy for the field names.
         :param categories: Category elements from a given list. Most products have more than one category.
-        :param item_dict: The dictionary to mutate with the given categories.
+        :param parsed_item: The ParsedItem to mutate with the given categories.
         """
         if categories:
             # We get the the categories and get their name, ID and URL.
             for key_name, tag in zip(CATEGORY_HIERARCHY, categories):
                 href = tag.get('href')
-                item_dict[key_name + "_id"] = re.search(ID_PATTERN, href).group().strip("/")
+                setattr(parsed_item, key_name + "_id", _extract_category_id(href))
                 category_name = tag.find('span')
                 if category_name:
                     category_name_text = category_name.get_text().strip().replace("\\", "")
-                    item_dict[key_name + "_name"] = category_name_text
-                    item_dict[key_name + "_url"] = href
+                    setattr(parsed_item, key_name + "_name", category_name_text)
+                    setattr(parsed_item, key_name + "_url", href)
 
     @staticmethod
-    def _parse_price_element(price, item_dict):
+    def _parse_price_element(price, parsed_item):
         """
-        Parses the price of a price element from a Gearbest product and mutates a dictionary with the given values.
+        Parses the price of a price element from a Gearbest product and mutates a ParsedItem with the given values.
         Retrieves the currency type and the price as a float value.
         :param price: The price element.
-        :param item_dict: The dictionary to mutate.
+        :param parsed_item: The ParsedItem to mutate.
         """
         if price:
             price_data = price.get_text().replace("\n", "").strip()
             item_price, item_currency = GearbestParser.parse_price(price_data)
-            item_dict["price"] = float(item_price)
-            item_dict["currency_type"] = item_currency
+            parsed_item.price = float(item_price)
+            parsed_item.currency_type = item_currency
 
     @staticmethod
-    def parse_item(item_content, parser='html.parser'):
+    def parse_item(item_content, parser='lxml', timestamp=None):
         """
         Parses the content of an item in order to retrieve meaningful data, in this case a timestamp, the item IDs, the price,
         whether it has a discount, the URL, the categories it belongs to, the description, the brand, the title, the rating,
         how many reviews it has, how many ratings it has, etcetera.
         :param item_content: The page source content for the file.
-        :param parser: The parser to use with BeautifulSoup, which by default is "html.parser".
-        :return: A dictionary containing as keys the title of the data we desire, and the data itself as its values.
+        :param parser: The parser to use with BeautifulSoup, which by default is "lxml".
+        :param timestamp: The scrape timestamp to stamp the item with. Batch callers pass one shared
+        timestamp for the whole batch instead of paying a clock read per item; by default the current time is used.
+        :return: A ParsedItem with the scraped fields set, or None if the page has no item data.
+        """
+        return GearbestParser._parse_item_from_soup(BeautifulSoup(item_content, parser), timestamp)
+
+    @staticmethod
+    def parse_page(content, parser='lxml', timestamp=None):
+        """
+        Parses both the item data and the inline reviews of a product page off a single soup. Tree
+        construction dominates parsing cost, so pages that need both are parsed once here instead of
+        once per public method.
+        :param content: The page source content for the product page.
+        :param parser: The parser to use with BeautifulSoup, which by default is "lxml".
+        :param timestamp: The scrape timestamp to stamp the item with, as in parse_item.
+        :return: The ParsedItem with any parsed reviews attached to its reviews field, or None if the
+        page has no item data.
         """
-        item_soup = BeautifulSoup(item_content, parser)
-        item = {}
+        soup = BeautifulSoup(content, parser)
+        item = GearbestParser._parse_item_from_soup(soup, timestamp)
+        if item is not None:
+            reviews = GearbestParser._retrieve_reviews_from_soup(soup)
+            if reviews:
+                item.reviews = reviews
+        return item
 
+    @staticmethod
+    def _parse_item_from_soup(item_soup, timestamp=None):
+        """
+        Parses the item data out of an already-built soup, so callers that hold a tree don't pay for
+        a second parse.
+        :param item_soup: The soup of the product page.
+        :param timestamp: The scrape timestamp to stamp the item with, as in parse_item.
+        :return: A ParsedItem with the scraped fields set, or None if the page has no item data.
+        """
         item_data = item_soup.find('div', {"class": "goodsIntro_infoWrap"})
         if not item_data:
             return None
 
-        timestamp = datetime.datetime.now()
-        item["timestamp"] = timestamp
+        item = ParsedItem(timestamp=timestamp or datetime.datetime.now())
+
+        # One descendant traversal instead of one find() per field: collect the first element for
+        # each field class in a single sweep, then dispatch. The per-field find() calls each re-walked
+        # the same subtree, which dominated parse time on large product pages.
+        found = {}
+        for element in item_data.find_all(True, class_=list(ITEM_FIELD_CLASSES)):
+            for class_name in element.get("class", ()):
+                if class_name in ITEM_FIELD_CLASSES and class_name not in found:
+                    found[class_name] = element
 
-        # Scraped data
-        name = item_data.find('h1', {'class': 'goodsIntro_title'})
-        GearbestParser._parse_basic_element(name, lambda x: x.get_text().strip().replace("\n", ""), item, "item_name")
+        GearbestParser._parse_basic_element(found.get('goodsIntro_title'), lambda x: _clean(x.get_text()),
+                                            item, "item_name")
 
         item_url_tag = item_soup.find('link', {'rel': 'canonical'})
         GearbestParser._parse_item_url(item_url_tag, item)
@@ -163,136 +275,190 @@ class GearbestParser:
         categories = item_soup.find_all('a', {'class': 'cGoodsCrumb_itemLink', 'itemprop': 'item'})
         GearbestParser._parse_categories(categories, item)
 
-        description = item_data.find('div', {'class': 'goodsIntro_summary'})
-        GearbestParser._parse_basic_element(description, lambda x: x.get_text(), item, "description")
+        GearbestParser._parse_basic_element(found.get('goodsIntro_summary'), lambda x: x.get_text(),
+                                            item, "description")
 
-        brand = item_data.find('label', {'class': 'goodsIntro_brand'})
-        GearbestParser._parse_basic_element(brand, lambda x: x.get_text()
-                                            .replace("Brand:\n", "")
-                                            .replace("\n", "")
-                                            .rstrip()
-                                            .strip(),
-                                            item,
-                                            "brand")
+        GearbestParser._parse_basic_element(found.get('goodsIntro_brand'),
+                                            lambda x: _clean(x.get_text(), prefix="Brand:"),
+                                            item, "brand")
 
-        rating = item_data.find('span', {'class': 'gbStarGrade_count'})
-        GearbestParser._parse_basic_element(rating,
-                                            lambda x: x.get_text().replace("\n", "").rstrip().strip(),
-                                            item,
-                                            "rating")
+        GearbestParser._parse_basic_element(found.get('gbStarGrade_count'), lambda x: _clean(x.get_text()),
+                                            item, "rating")
 
-        customer_reviews_count = item_data.find('a', {'class': 'goodsIntro_reviews'})
-        GearbestParser._parse_basic_element(customer_reviews_count,
-                                            lambda x: re.sub(DIGIT_PATTERN, "", x.get_text()),
+        GearbestParser._parse_basic_element(found.get('goodsIntro_reviews'),
+                                            lambda x: _DIGIT_RE.sub("", x.get_text()),
                                             item,
                                             "customer_reviews_count")
 
-        customer_answer_count = item_data.find('a', {'class': 'goodsIntro_faq'})
-        GearbestParser._parse_basic_element(customer_answer_count,
-                                            lambda x: re.sub(DIGIT_PATTERN, "", x.get_text()),
+        GearbestParser._parse_basic_element(found.get('goodsIntro_faq'),
+                                            lambda x: _DIGIT_RE.sub("", x.get_text()),
                                             item,
                                             "customer_answer_count")
 
-        price = item_data.find('span', {'class': 'goodsIntro_price'})
-        GearbestParser._parse_price_element(price, item)
+        GearbestParser._parse_price_element(found.get('goodsIntro_price'), item)
 
-        discount = item_data.find('span', {'class': 'goodsIntro_priceDiscount'})
-        GearbestParser._parse_basic_element(discount,
-                                            lambda x: re.sub(DIGIT_PATTERN, "", x.get_text()),
+        GearbestParser._parse_basic_element(found.get('goodsIntro_priceDiscount'),
+                                            lambda x: _DIGIT_RE.sub("", x.get_text()),
                                             item,
                                             "discount")
 
         return item
 
     @staticmethod
-    def parse_catalog_content(content, parser='html.parser'):
+    def parse_catalog_content(content):
         """
         Parses the content of the catalog of a given category and returns the IDs and URLs of all the products belong to that catalog in that specific page.
+        These selectors are trivial and run once per catalog page, so the tree is built and traversed
+        directly with lxml instead of paying BeautifulSoup's per-tag wrapping.
         :param content: The static content to parse.
-        :param parser: Parsing method, usually 'html.parser'
-        :param url: The URL of the category.
         :return: Returns the Item IDs and URLs of each item in the catalog for a specific page, if there is one.
         """
+        return GearbestParser._parse_catalog_items_from_tree(lxml.html.fromstring(content))
 
-        soup = BeautifulSoup(content, parser)
-        unordered_list = soup.find('ul', {'class': 'js_seachResultList'})
-        if not unordered_list:
-            unordered_list = soup.find('ul', {'class': 'brandList_content'})
-        list_items = unordered_list.find_all('li', {"class": "gbGoodsItem"})
+    @staticmethod
+    def _parse_catalog_items_from_tree(tree):
+        """
+        The tree-level half of parse_catalog_content, so parse_catalog_page can reuse an
+        already-built tree.
+        :param tree: The lxml tree of the catalog page.
+        :return: Returns the Item IDs and URLs of each item in the catalog for a specific page, if there is one.
+        """
+        list_items = tree.xpath("//ul[contains(@class, 'js_seachResultList') or contains(@class, 'brandList_content')]"
+                                "//li[contains(@class, 'gbGoodsItem')]")
 
-        item_urls = [list_item.find('a').get('href') for list_item in list_items]
-        item_ids = [item_url[item_url.rfind("/") + 1:item_url.rfind(".")] for item_url in item_urls]
-        item_ids_and_urls = list(zip(item_ids, item_urls))
+        item_ids_and_urls = []
+        for list_item in list_items:
+            anchor = list_item.find('.//a')
+            if anchor is None:
+                continue
+            item_url = anchor.get('href')
+            # rpartition does the scan and the split in one C call, instead of rfind plus slicing.
+            item_ids_and_urls.append((item_url.rpartition("/")[2].rpartition(".")[0], item_url))
 
         return item_ids_and_urls
 
     @staticmethod
-    def retrieve_next_page(content, parser='html.parser'):
+    def retrieve_next_page(content):
         """
         Parses the pages in a catalog in order to return the following link. If there's no following link to the next page, returns None.
         :param content: The static content to parse.
-        :param parser: Parsing method, usually 'html.parser'
         :return: The link to the following page if it exists, otherwise None.
         """
-        soup = BeautifulSoup(content, parser)
-        next_page_div = soup.find("div", {"class": "cateMain_pages"})
-        next_page = next_page_div.find("a", {"class": "pageNext"})
-        are_valid_attrs = "disable" not in next_page.attrs["class"]
-        if are_valid_attrs:
-            return next_page.get("href")
-        return None
+        return GearbestParser._retrieve_next_page_from_tree(lxml.html.fromstring(content))
+
+    @staticmethod
+    def _retrieve_next_page_from_tree(tree):
+        """
+        The tree-level half of retrieve_next_page, so parse_catalog_page can reuse an already-built tree.
+        :param tree: The lxml tree of the catalog page.
+        :return: The link to the following page if it exists, otherwise None.
+        """
+        hrefs = tree.xpath("//div[contains(@class, 'cateMain_pages')]"
+                           "//a[contains(@class, 'pageNext') and not(contains(@class, 'disable'))]/@href")
+        return hrefs[0] if hrefs else None
+
+    @staticmethod
+    def parse_catalog_page(content):
+        """
+        Parses a catalog page's item list and its next-page link off one lxml tree; calling
+        parse_catalog_content and retrieve_next_page separately builds the same tree twice per page.
+        :param content: The static content to parse.
+        :return: A tuple with the item IDs and URLs in the page and the next page's URL (None on the last page).
+        """
+        tree = lxml.html.fromstring(content)
+        return (GearbestParser._parse_catalog_items_from_tree(tree),
+                GearbestParser._retrieve_next_page_from_tree(tree))
+
+    @staticmethod
+    def prefetch_pagination(content, fetch):
+        """
+        Iterates over a paginated catalog, fetching the next page in the background while the caller
+        processes the current one. Each next-page URL is only discovered by parsing the page that
+        links to it, so the lookahead is a single page: the fetch of page N+1 overlaps with whatever
+        the caller does with page N instead of starting after it.
+        :param content: The content of the first catalog page.
+        :param fetch: A callable that takes a URL and returns that page's content.
+        :return: A generator over the content of each catalog page in order.
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            while content:
+                next_page = GearbestParser.retrieve_next_page(content)
+                next_future = executor.submit(fetch, next_page) if next_page else None
+                yield content
+                content = next_future.result() if next_future else None
 
     @staticmethod
-    def retrieve_catalog_sort_by_new_url(content, parser='html.parser'):
+    def retrieve_catalog_sort_by_new_url(content):
         """
         Retrieves the URL for the sorted by newest elements in catalog pages.
         :param content: The content to parse.
-        :param parser: The parser to use.
         :return:
         """
-        soup = BeautifulSoup(content, parser)
-        sort_item_box = soup.find('p', {'class': 'js-SortItemBox'})
-        if not sort_item_box:
+        tree = lxml.html.fromstring(content)
+        sort_item_boxes = tree.xpath("//p[contains(@class, 'js-SortItemBox')]")
+        if not sort_item_boxes:
             raise ParsingError("Invalid catalog site.")
-        sorting_links = sort_item_box.find_all('a', {'class': 'js-orderItem'})
-        for link in sorting_links:
-            text = link.get_text()
+        for link in sort_item_boxes[0].xpath(".//a[contains(@class, 'js-orderItem')]"):
+            text = link.text_content()
             if text and "New" in text:
                 return link.get('href')
         return None
 
     @staticmethod
-    def retrieve_new_review_page_element(content, parser='html.parser'):
+    def retrieve_new_review_page_element(content):
         """
         Method that parses a JavaScript-generated element that contains the link or action in this case for the next
         given page if it exists, otherwise it returns None. In this case the pages are created by AJAX requests,
         which means that the source changes slightly but it's not a full change. The parser does not know about this though,
-        the scraper does.
+        the scraper does. This runs once per review page in the pagination loop, so the single anchor is reached
+        with one lxml XPath instead of building a BeautifulSoup tree for it. Callers should compare the result
+        against None, since lxml element truthiness depends on child count.
         :param content: The source content of a given page.
-        :param parser: The parser to use with BeautifulSoup which by default is "html.parser".
         :return: The element that contains the next page action if it exists, otherwise None.
         """
-        soup = BeautifulSoup(content, parser)
-        review_page_div = soup.find('div', {'class': 'goodsReviews_pageWrap'})
-        if not review_page_div:
+        tree = lxml.html.fromstring(content)
+        buttons = tree.xpath("//div[contains(@class, 'goodsReviews_pageWrap')]"
+                             "//div[contains(@class, 'gbPaging')]//a[@data-goto='next']")
+        if not buttons:
             return None
-        next_page_div = review_page_div.find('div', {'class': 'gbPaging'})
-        if not next_page_div:
-            return None
-        next_page_button = next_page_div.find('a', {'data-goto': 'next'})
-        if "disabled" in next_page_button.attrs["class"]:
+        next_page_button = buttons[0]
+        if "disabled" in next_page_button.get("class", "").split():
             return None
         return next_page_button
 
     @staticmethod
-    def retrieve_reviews_from_item(content, parser='html.parser'):
+    def retrieve_reviews_from_item(content, parser='lxml'):
         """
         Parses the source in order to retrieve all reviews present in the static piece of content.
         :param content: The static source content from the page.
-        :param parser: The parser to use with BeautifulSoup, which by default is "html.parser".
+        :param parser: The parser to use with BeautifulSoup, which by default is "lxml".
         :return: A list of reviews for the item for which the content was provided.
         """
+        return GearbestParser._retrieve_reviews_from_soup(BeautifulSoup(content, parser))
+
+    @staticmethod
+    def parse_review_page(content, parser='lxml'):
+        """
+        Parses a review page's reviews and whether its pagination has a next page off one soup;
+        calling retrieve_reviews_from_item and retrieve_new_review_page_element separately parses
+        the same HTML twice per page.
+        :param content: The static source content of the review page.
+        :param parser: The parser to use with BeautifulSoup, which by default is "lxml".
+        :return: A tuple with the page's reviews and whether a next review page exists.
+        """
         soup = BeautifulSoup(content, parser)
+        reviews = GearbestParser._retrieve_reviews_from_soup(soup)
+        next_button = soup.select_one('div[class*="goodsReviews_pageWrap"] div[class*="gbPaging"] a[data-goto="next"]')
+        has_next_page = next_button is not None and "disabled" not in (next_button.get("class") or [])
+        return reviews, has_next_page
+
+    @staticmethod
+    def _retrieve_reviews_from_soup(soup):
+        """
+        Retrieves the reviews out of an already-built soup, the review counterpart of _parse_item_from_soup.
+        :param soup: The soup of the page that contains the reviews.
+        :return: A list of reviews for the item for which the soup was built.
+        """
         reviews_div = soup.find('div', {'id': 'js-reviewWrap'})
 
         if not reviews_div:
@@ -302,7 +468,7 @@ class GearbestParser:
         item_id = None
         if item_url_tag:
             item_url = item_url_tag.get('href')
-            item_id = re.search(ID_PATTERN, item_url).group().rstrip(".")
+            item_id = _ID_RE.search(item_url).group().rstrip(".")
 
         reviews_list_elements = soup.find_all('li', {'class': 'goodsReviews_item'})
 
@@ -311,21 +477,40 @@ class GearbestParser:
 
         reviews = []
         for review in reviews_list_elements:
-            review_dict = {}
+            review_fields = {}
             user_name_and_id = GearbestParser.retrieve_username_and_id_from_review(review)
 
             if user_name_and_id:
-                review_dict.update(user_name_and_id)
+                review_fields.update(user_name_and_id)
 
             review_data = GearbestParser.retrieve_review_data_from_review(review)
             if review_data:
-                review_dict.update(review_data)
+                review_fields.update(review_data)
 
-            if review_dict:
-                review_dict['item_id'] = item_id
-                reviews.append(review_dict)
+            if review_fields:
+                review_fields['item_id'] = item_id
+                reviews.append(ParsedReview(**review_fields))
         return reviews
 
+    REVIEW_COLUMNS = ('user_name', 'user_id', 'review_title', 'review_rating', 'review_attributes',
+                      'review_text', 'post_timestamp', 'item_id')
+
+    @staticmethod
+    def reviews_as_columns(reviews):
+        """
+        Repacks a list of ParsedReview objects into one dictionary of per-field lists, aligned by
+        index. Columnar consumers such as LanguageEnricher.get_languages can then take a single
+        column (e.g. review_text) directly instead of plucking the same field out of every review.
+        :param reviews: The ParsedReview objects as returned by retrieve_reviews_from_item.
+        :return: A dictionary mapping each review field to a list with one entry per review.
+        """
+        columns = {column: [] for column in GearbestParser.REVIEW_COLUMNS}
+        if reviews:
+            for review in reviews:
+                for column in GearbestParser.REVIEW_COLUMNS:
+                    columns[column].append(getattr(review, column, None))
+        return columns
+
     @staticmethod
     def retrieve_username_and_id_from_review(review):
         """
@@ -359,25 +544,23 @@ class GearbestParser:
             review_attributes = review_attributes_tag.get_text()
 
         review_texts = review.find_all('dl', {'class': 'goodsReviews_itemCont'})
-        review_text = ""
+        # Fragments are collected and joined once at the end: repeated += rebuilds the string per
+        # fragment, which is quadratic on reviews with many dl blocks.
+        review_text_parts = []
         for element in review_texts:
             element_title = element.find('dt')
             if element_title:
-                review_text += "\n" + element_title.get_text()
+                review_text_parts.append(element_title.get_text())
             text = element.find('dd')
             if text:
-                review_text += "\n" + text.get_text()
+                review_text_parts.append(text.get_text())
+        # The leading newline matches what the += chain produced.
+        review_text = "\n" + "\n".join(review_text_parts) if review_text_parts else ""
 
         time = None
         time_tag = review.find('p', {'class': 'goodsReviews_itemTime'})
         if time_tag:
-            time_text = time_tag.get_text().strip()
-            try:
-                time = datetime.datetime.strptime(time_text, REVIEW_DATE_FORMAT_BASIC)
-            except ValueError:
-                time = datetime.datetime.strptime(time_text, REVIEW_DATE_FORMAT_COMPLEX)
-            except Exception:
-                time = None
+            time = _parse_review_time(time_tag.get_text().strip())
 
         return {'review_title': title, 'review_rating': title_rating, 'review_attributes': review_attributes,
                 'review_text': review_text, 'post_timestamp': time}
@@ -3,12 +3,21 @@ Authors: François Oren Chikli, Juan Amari
 File for the scraper class.
 """
 
+import hashlib
 import logging
 import math
-
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from itertools import takewhile
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
 from selenium import webdriver
 from selenium.common.exceptions import TimeoutException, WebDriverException
-from selenium.webdriver.common.action_chains import ActionChains
 
 from database_classes.gearbest_mysql_manager import GearbestMySQLManager
 from database_classes.gearbest_query_manager import DATABASE_NAME
@@ -16,27 +25,198 @@ from gearbest_scraping.errors.parsing_error import ParsingError
 from gearbest_scraping.gearbest_parser import GearbestParser
 
 GEARBEST_URL = r"https://www.gearbest.com/"
-REVIEW_NEXT_XPATH = r"//div[@class='goodsReviews_pageWrap']//a[@data-goto='next']"
-SORTING_OPTIONS_XPATH = r"//*[@id='js-reviewFilter']/li[4]"
-REVIEW_MOST_RECENT_XPATH = r"//*[@id='js-reviewFilter']/li[4]/div/div/a[4]"
+REVIEW_NEXT_CSS = "div.goodsReviews_pageWrap a[data-goto='next']"
+REVIEW_MOST_RECENT_CSS = "#js-reviewFilter > li:nth-child(4) > div > div > a:nth-child(4)"
+
+# Clicks the first node matching a CSS selector from inside the page and reports whether it
+# existed. A single execute_script round trip replaces the hover/click command sequences, each of
+# which was its own JSON-over-HTTP round trip to Chromedriver; dispatching the click in the page
+# also makes the hover that made the sort menu interactable unnecessary. querySelector goes through
+# the browser's CSS engine, which is considerably faster than document.evaluate's XPath evaluator —
+# and the pagination click runs once per review page.
+JS_CLICK_SELECTOR = ("var result = document.querySelector(arguments[0]); "
+                     "if (result) { result.click(); return true; } return false;")
+
+# The review item selector matching the elements the parser extracts reviews from.
+REVIEW_ITEM_CSS = "li.goodsReviews_item"
+
+# Walks the review pagination entirely inside the page in one execute_async_script call: click
+# next, wait for the review list to re-render, capture the review items, repeat until the limit or
+# the last page, then hand every page back at once. One driver round trip replaces the per-page
+# click / read HTML / parse cycle, and only the review items travel back over the wire instead of
+# the full document per page. A negative limit means no page limit.
+JS_COLLECT_REVIEW_PAGES = """
+var done = arguments[arguments.length - 1];
+var limit = arguments[0];
+var nextSelector = arguments[1];
+var itemSelector = arguments[2];
+var fragments = [];
+var finished = false;
+function finish() { if (!finished) { finished = true; done(fragments); } }
+function currentFragment() {
+    var items = document.querySelectorAll(itemSelector);
+    // The parser only looks for review items inside the js-reviewWrap container, so the fragment
+    // reproduces that wrapper around the captured items.
+    var itemsHtml = Array.prototype.map.call(items, function (el) { return el.outerHTML; }).join("");
+    return '<div id="js-reviewWrap"><ul>' + itemsHtml + '</ul></div>';
+}
+function step() {
+    if (finished) { return; }
+    if (limit >= 0 && fragments.length >= limit) { finish(); return; }
+    var next = document.querySelector(nextSelector);
+    if (!next || (" " + next.className + " ").indexOf(" disabled ") !== -1) { finish(); return; }
+    var guard;
+    var observer = new MutationObserver(function () {
+        observer.disconnect();
+        clearTimeout(guard);
+        setTimeout(function () { fragments.push(currentFragment()); step(); }, 250);
+    });
+    observer.observe(document.body, {childList: true, subtree: true});
+    guard = setTimeout(function () { observer.disconnect(); finish(); }, 10000);
+    next.click();
+}
+step();
+"""
+
+# Upper bound in seconds for one in-page review collection run.
+REVIEW_COLLECT_SCRIPT_TIMEOUT = 300
+
+# Third-party trackers and media assets contribute nothing to what the parser extracts; blocking
+# them at the network layer stops the connections entirely, where the content prefs only skip
+# rendering what was already downloaded.
+BLOCKED_URL_PATTERNS = [
+    "*.doubleclick.net*", "*google-analytics*", "*facebook.net*",
+    "*.jpg", "*.png", "*.webp", "*.gif", "*.woff*", "*.mp4",
+]
+
+# Connect and read timeouts in seconds for static page fetches.
+REQUEST_TIMEOUT = (5, 30)
+# Pooled keep-alive connections for the static fetch session.
+STATIC_POOL_SIZE = 8
+# How many department worker processes to run in parallel by default.
+DEPARTMENT_WORKERS = 4
+# On-disk cache for static page sources, keyed by URL hash. Re-scrapes and incremental review crawls
+# hit disk instead of the network while an entry is younger than the TTL.
+SCRAPER_CACHE_DIR = ".scraper_cache"
+CACHE_TTL_SECONDS = 6 * 3600
+# How many catalog items the pagination producer may queue ahead of the consumer.
+ITEM_QUEUE_MAXSIZE = 64
+# How often a blocked producer put re-checks whether the consumer has stopped.
+ITEM_QUEUE_PUT_POLL_SECONDS = 1
+# Marks the end of the catalog item queue.
+_QUEUE_SENTINEL = object()
+# Distinguishes "no last seen timestamp was provided" from "the item has no seen reviews" (None).
+_TIMESTAMP_UNKNOWN = object()
+
+
+def _scrape_department_worker(department_url, max_products, review_limit, sort_by_newest):
+    """
+    Worker entry point for department-level parallel scraping. Each worker process builds its own
+    GearbestScraper — and therefore its own Chromedriver — because Selenium sessions cannot be shared
+    across threads; departments scale with processes, not threads.
+    :param department_url: The URL of the department catalog to scrape.
+    :param max_products: The maximum amount of products to scrape from the department.
+    :param review_limit: The maximum amount of review pages to scrape per product.
+    :param sort_by_newest: Whether to sort products by newest or most relevant.
+    :return: The list of items scraped from the department.
+    """
+    with GearbestScraper() as scraper:
+        return list(scraper.scrape_paginated_catalog(department_url, max_products=max_products,
+                                                     review_limit=review_limit, sort_by_newest=sort_by_newest))
 
 
 class GearbestScraper:
 
-    def __init__(self):
-        """Initialization function. Instances a Chrome webdriver for scraping."""
-        options = webdriver.ChromeOptions()
-        options.add_argument('--headless')
-        self.driver = webdriver.Chrome(options=options)
+    def __init__(self, max_concurrency=5, disable_cache=False, remote_url=None):
+        """
+        Initialization function. Sets up a pooled HTTP session for static page fetches; the Chrome
+        webdriver is spawned lazily on first use, since pages that don't need JavaScript never pay
+        for the browser at all.
+        :param max_concurrency: How many static page fetches to keep in flight while prefetching.
+        :param disable_cache: Whether to bypass the on-disk page cache, mainly for testing.
+        :param remote_url: Optional URL of an already-running webdriver server; connecting to it
+        skips the per-run Chromedriver launch, which dominates short scrape invocations.
+        """
+        self._driver = None
+        self.max_concurrency = max_concurrency
+        self.disable_cache = disable_cache
+        self.remote_url = remote_url
+        # One MySQL connection for the scraper's lifetime, opened on first lookup; the lock keeps the
+        # pagination producer and the consumer from interleaving queries on it.
+        self._sql_mgr = None
+        self._sql_lock = threading.Lock()
+        # Item URLs already scraped this run. Promoted and related items recur across catalog pages
+        # and departments, and every duplicate skipped here saves a full item scrape.
+        self._seen_urls = set()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=STATIC_POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Prefetches static item HTML over the session while the driver works serially; Selenium is
+        # not thread-safe, so the browser itself never runs on these workers.
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=max_concurrency)
         self.logger = logging.getLogger("GearbestLogger")
 
+    @property
+    def driver(self):
+        """Creates the headless Chrome webdriver on first access and reuses it afterwards."""
+        if self._driver is None:
+            options = webdriver.ChromeOptions()
+            options.add_argument('--headless')
+            # Only text ever gets parsed out of the pages, so images, stylesheets and fonts —
+            # the bulk of each page's bytes and render time — are not loaded at all.
+            options.add_argument('--blink-settings=imagesEnabled=false')
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.managed_default_content_settings.stylesheets": 2,
+                "profile.managed_default_content_settings.fonts": 2,
+            })
+            options.add_argument('--disable-gpu')
+            options.add_argument('--no-sandbox')
+            options.add_argument('--disable-dev-shm-usage')
+            # driver.get returns at DOMContentLoaded instead of waiting for every subresource.
+            options.set_capability("pageLoadStrategy", "eager")
+            if self.remote_url:
+                # Connects to a long-lived Chromedriver server (see the scrape_daemon command)
+                # instead of launching a fresh one for this run.
+                self._driver = webdriver.Remote(command_executor=self.remote_url, options=options)
+            else:
+                self._driver = webdriver.Chrome(options=options)
+            if hasattr(self._driver, "execute_cdp_cmd"):
+                # Remote drivers don't expose the CDP bridge; they still get the content prefs above.
+                self._driver.execute_cdp_cmd("Network.enable", {})
+                self._driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        return self._driver
+
+    def _page_html(self):
+        """
+        Reads the current page's HTML through a single CDP command, skipping the WebDriver JSON wire
+        serialization that driver.page_source pays on every read — the review pagination loop reads
+        the page once per iteration. Remote drivers without a CDP bridge fall back to page_source.
+        :return: The current page source.
+        """
+        driver = self.driver
+        if hasattr(driver, "execute_cdp_cmd"):
+            return driver.execute_cdp_cmd("Runtime.evaluate",
+                                          {"expression": "document.documentElement.outerHTML",
+                                           "returnByValue": True})["result"]["value"]
+        return driver.page_source
+
     def __enter__(self):
         """Context manager function, returns self the scope is created."""
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager function, closes the web driver once out of scope."""
-        self.driver.close()
+        """Context manager function, closes the web driver (if one was spawned) and the HTTP session once out of scope."""
+        if self._driver is not None:
+            self._driver.close()
+        self._prefetch_executor.shutdown()
+        if self._sql_mgr is not None:
+            # Under the lock so a catalog producer thread mid-query doesn't have the shared
+            # connection committed and closed out from underneath it.
+            with self._sql_lock:
+                self._sql_mgr.__exit__(exc_type, exc_val, exc_tb)
+        self.session.close()
 
     def scrape_all_departments(self, product_limit_per_department=math.inf, review_limit=math.inf, sort_by_newest=True):
         """
@@ -47,20 +227,59 @@ class GearbestScraper:
         :param sort_by_newest: Whether to sort products by newest or most relevant.
         :return: A list containing all the items and their reviews.
         """
-        department_content = self.retrieve_source_from_url(GEARBEST_URL)
-        departments = set(GearbestParser.parse_departments(department_content))
+        department_content = self.retrieve_source_from_url(GEARBEST_URL, needs_js=False)
+        departments = list(set(GearbestParser.parse_departments(department_content)))
         self.logger.info(
             "Avoiding Top Brands and Fashion departments due to duplicate elements" +
             ", for those elements use the single catalog configuration.")
         self.logger.info("Scraping departments %s" % ", ".join([x[0] for x in departments]))
 
-        for department_name, department_url in departments:
+        # Each department's entry-page HTML is prefetched one ahead: department N+1's fetch is
+        # submitted before department N is yielded, so it downloads while N's items are still being
+        # scraped and the department switch costs no network wait.
+        next_future = (self._prefetch_executor.submit(self.retrieve_source_from_url, departments[0][1], False)
+                       if departments else None)
+        for index, (department_name, department_url) in enumerate(departments):
+            content_future = next_future
+            next_future = (self._prefetch_executor.submit(self.retrieve_source_from_url,
+                                                          departments[index + 1][1], False)
+                           if index + 1 < len(departments) else None)
             self.logger.info("Scraping department %s, URL %s" % (department_name, department_url))
             department_items = self.scrape_paginated_catalog(department_url, max_products=product_limit_per_department,
-                                                             review_limit=review_limit, sort_by_newest=sort_by_newest)
+                                                             review_limit=review_limit, sort_by_newest=sort_by_newest,
+                                                             initial_content=content_future.result())
             yield department_items
 
-    def scrape_paginated_catalog(self, url, max_products=math.inf, review_limit=math.inf, sort_by_newest=True):
+    def scrape_all_departments_parallel(self, n_workers=DEPARTMENT_WORKERS, product_limit_per_department=math.inf,
+                                        review_limit=math.inf, sort_by_newest=True):
+        """
+        Department-level parallel counterpart of scrape_all_departments. The department list is parsed
+        here, then each department is handed to a worker process that owns its own scraper and driver,
+        so departments overlap instead of queueing behind one browser. Department item lists are
+        yielded as their workers finish, so the order is completion order, not department order.
+        :param n_workers: How many department worker processes to run at once.
+        :param product_limit_per_department: How many products to scrape from each department.
+        :param review_limit: How many review pages to scrape from each product.
+        :param sort_by_newest: Whether to sort products by newest or most relevant.
+        :return: A generator over each department's scraped item list.
+        """
+        department_content = self.retrieve_source_from_url(GEARBEST_URL, needs_js=False)
+        departments = set(GearbestParser.parse_departments(department_content))
+        self.logger.info(
+            "Avoiding Top Brands and Fashion departments due to duplicate elements" +
+            ", for those elements use the single catalog configuration.")
+        self.logger.info("Scraping departments %s in %s processes" % (
+            ", ".join([x[0] for x in departments]), n_workers))
+
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = [executor.submit(_scrape_department_worker, department_url, product_limit_per_department,
+                                       review_limit, sort_by_newest)
+                       for _, department_url in departments]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def scrape_paginated_catalog(self, url, max_products=math.inf, review_limit=math.inf, sort_by_newest=True,
+                                 initial_content=None):
         """
         Scrapes a catalog or department. Since both have a similar structure, it can be used for any of the two.
         This is yet another method that wraps scrape_item, which is the most granular form of scraping apart from reviews,
@@ -69,6 +288,8 @@ class GearbestScraper:
         :param max_products: The maximum amount of products to scrape from that specific catalog.
         :param review_limit: The maximum amount of review pages to scrape from the product (if it has reviews).
         :param sort_by_newest: Whether to sort products by newest or most relevant.
+        :param initial_content: Optionally, the already-fetched HTML of the catalog's entry page,
+        so callers that prefetched it (see scrape_all_departments) skip the first fetch here.
         :return: A list of items belonging to the catalog along with their reviews.
         """
         self.logger.info("Scraping %s for catalog %s\n" % (
@@ -76,38 +297,128 @@ class GearbestScraper:
 
         parsed_count = 0
 
+        # Catalog listings are server-rendered, so they go over the HTTP session instead of paying a
+        # browser render per page; only item review interaction needs the driver.
         if sort_by_newest:
-            non_sorted_page_source = self.retrieve_source_from_url(url)
-            current_page = GearbestParser.retrieve_catalog_sort_by_new_url(non_sorted_page_source, 'html.parser')
+            non_sorted_page_source = initial_content or self.retrieve_source_from_url(url, needs_js=False)
+            current_page = GearbestParser.retrieve_catalog_sort_by_new_url(non_sorted_page_source)
+            # The sorted listing is a different URL; its content still needs its own fetch.
+            initial_content = None
         else:
             current_page = url
 
-        while current_page and parsed_count < max_products:
-            page_content = self.retrieve_source_from_url(current_page)
-            self.logger.info("Retrieving items from page %s" % current_page)
+        # Producer/consumer pipeline: a background thread walks the pagination over the HTTP session
+        # and keeps the bounded queue filled (prefetching each item's HTML as it goes), while this
+        # thread scrapes items with the driver. Page N+1 is therefore fetched and parsed while page
+        # N's items are still being scraped, instead of waiting behind them.
+        item_queue = queue.Queue(maxsize=ITEM_QUEUE_MAXSIZE)
+        stop_event = threading.Event()
+        producer = threading.Thread(target=self._produce_catalog_items,
+                                    args=(current_page, item_queue, stop_event, initial_content),
+                                    daemon=True)
+        producer.start()
 
-            item_ids_and_urls = None
-            try:
-                item_ids_and_urls = GearbestParser.parse_catalog_content(page_content, 'html.parser')
-            except Exception as err:
-                self.logger.error(str(err) + " -- Error with: %s" % url)
-                yield None
-
-            if not item_ids_and_urls:
-                yield None
-                raise ParsingError("Invalid catalog site.")
-
-            for item_id, url in item_ids_and_urls:
-                if max_products < parsed_count:
+        try:
+            while parsed_count < max_products:
+                entry = item_queue.get()
+                if entry is _QUEUE_SENTINEL:
                     break
-                product = self.scrape_item(url, review_limit=review_limit)
+                if isinstance(entry, Exception):
+                    self.logger.error(str(entry) + " -- Error with: %s" % url)
+                    yield None
+                    if isinstance(entry, ParsingError):
+                        raise entry
+                    continue
+
+                item_id, item_url, prefetched, last_seen_timestamp = entry
+                product = self.scrape_item(item_url, review_limit=review_limit, item_content=prefetched.result(),
+                                           last_seen_timestamp=last_seen_timestamp)
                 if product:
                     parsed_count += 1
 
                 yield product
+        finally:
+            # Runs when the consumer hits max_products or abandons the generator: signals the
+            # producer to stop and drains the queue so neither the thread nor the prefetched page
+            # HTML it queued outlives this scrape.
+            stop_event.set()
+            while True:
+                try:
+                    item_queue.get_nowait()
+                except queue.Empty:
+                    break
 
-            next_page = GearbestParser.retrieve_next_page(page_content, 'html.parser')
-            current_page = next_page
+    def _produce_catalog_items(self, current_page, item_queue, stop_event, initial_content=None):
+        """
+        Producer side of the catalog pipeline. Walks the catalog pagination over the HTTP session,
+        parses each page, and enqueues one (item_id, item_url, prefetch future) entry per item; the
+        prefetch future resolves to the item's page source. Errors are enqueued as exception objects
+        so the consumer can surface them, and a sentinel marks the end of the catalog. Once the
+        consumer sets stop_event — after max_products or when the generator is dropped — the walk
+        ends instead of blocking forever on the bounded queue.
+        :param current_page: The URL of the first catalog page to walk.
+        :param item_queue: The bounded queue shared with the consumer.
+        :param stop_event: The event the consumer sets when it no longer takes entries.
+        :param initial_content: Optionally, the first page's already-fetched HTML.
+        """
+        try:
+            page_content = initial_content or self.retrieve_source_from_url(current_page, needs_js=False)
+            while page_content and not stop_event.is_set():
+                self.logger.info("Retrieving items from page %s" % current_page)
+
+                # One tree build serves both the item list and the next-page link.
+                item_ids_and_urls, next_page = GearbestParser.parse_catalog_page(page_content)
+                if not item_ids_and_urls:
+                    self._enqueue_unless_stopped(item_queue, ParsingError("Invalid catalog site."), stop_event)
+                    return
+
+                # The next page's fetch starts before this page's items are enqueued: enqueueing
+                # blocks on the bounded queue while the consumer catches up, and the next-page fetch
+                # runs through that wait instead of after it.
+                next_future = (self._prefetch_executor.submit(self.retrieve_source_from_url, next_page, False)
+                               if next_page else None)
+
+                # One bulk query covers the whole page's last seen review timestamps.
+                last_seen_timestamps = self.retrieve_last_seen_timestamps(
+                    [item_id for item_id, _ in item_ids_and_urls])
+
+                for item_id, item_url in item_ids_and_urls:
+                    # Catalog pages repeat items (promotions, adjacent categories); scrape each URL
+                    # once per run.
+                    if item_url in self._seen_urls:
+                        continue
+                    self._seen_urls.add(item_url)
+                    prefetched = self._prefetch_executor.submit(self.retrieve_source_from_url, item_url, False)
+                    entry = (item_id, item_url, prefetched, last_seen_timestamps.get(item_id))
+                    if not self._enqueue_unless_stopped(item_queue, entry, stop_event):
+                        return
+
+                if next_future is None:
+                    return
+                current_page = next_page
+                page_content = next_future.result()
+        except Exception as err:
+            self._enqueue_unless_stopped(item_queue, err, stop_event)
+        finally:
+            self._enqueue_unless_stopped(item_queue, _QUEUE_SENTINEL, stop_event)
+
+    @staticmethod
+    def _enqueue_unless_stopped(item_queue, entry, stop_event):
+        """
+        Puts an entry on the bounded queue, polling the stop event instead of blocking indefinitely
+        while the queue is full, so a stopped consumer doesn't strand the producer in put.
+        :param item_queue: The bounded queue shared with the consumer.
+        :param entry: The entry to enqueue.
+        :param stop_event: The event the consumer sets when it no longer takes entries.
+        :return: Whether the entry was enqueued before the stop event was set.
+        """
+        while not stop_event.is_set():
+            try:
+                item_queue.put(entry, timeout=ITEM_QUEUE_PUT_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
 
     def retrieve_items_from_catalog_page(self, url):
         """
@@ -117,54 +428,83 @@ class GearbestScraper:
         :return: A list of item URLs and their IDs.
         """
         self.logger.info("Scraping catalog from %s" % url)
-        catalog_content = self.retrieve_source_from_url(url)
-        return GearbestParser.parse_catalog_content(catalog_content, 'html.parser')
+        catalog_content = self.retrieve_source_from_url(url, needs_js=False)
+        return GearbestParser.parse_catalog_content(catalog_content)
 
-    def scrape_item(self, url, scrape_reviews=True, review_limit=math.inf):
+    def scrape_item(self, url, scrape_reviews=True, review_limit=math.inf, item_content=None,
+                    last_seen_timestamp=_TIMESTAMP_UNKNOWN):
         """
         Scrapes an item from the given URL along with its reviews which by default is enabled up to as many pages as review_limit denotes.
         :param url: The URL of the item resource.
         :param scrape_reviews: A condition on whether to scrape reviews or not.
         :param review_limit: The maximum amount of review pages to scrape from the item.
+        :param item_content: Optionally, already-fetched page source for the item, letting batch
+        callers prefetch item HTML concurrently instead of fetching here.
+        :param last_seen_timestamp: Optionally, the item's already-looked-up last seen review
+        timestamp, as supplied by the per-page bulk lookup; left unset, it's queried per item.
         :return:
         """
         self.logger.info("Scraping product from %s" % url)
+        prefetched = item_content is not None
         try:
-            item_content = self.retrieve_source_from_url(url)
-            item_data = GearbestParser.parse_item(item_content, 'html.parser')
+            if not prefetched:
+                item_content = self.retrieve_source_from_url(url)
+            item_data = GearbestParser.parse_item(item_content)
             self.logger.debug(item_data)
         except Exception as err:
             self.logger.error(err)
             return None
         if scrape_reviews:
             try:
-                hover_element = self.driver.find_element_by_xpath(SORTING_OPTIONS_XPATH)
-                sorting_element = self.driver.find_element_by_xpath(REVIEW_MOST_RECENT_XPATH)
-                hover_and_click = ActionChains(self.driver).move_to_element(hover_element).move_to_element(
-                    sorting_element).click(sorting_element)
-                hover_and_click.perform()
-                item_content = self.driver.page_source
+                if prefetched:
+                    # The driver never navigated to the item, so load it before the review interaction.
+                    self.driver.get(url)
+                if not self.driver.execute_script(JS_CLICK_SELECTOR, REVIEW_MOST_RECENT_CSS):
+                    # Without the newest-first sort the delta filter's ordering assumption doesn't
+                    # hold, so reviews are skipped just as the old element lookup failure did.
+                    self.logger.error("Review sort element not found for %s, skipping reviews." % url)
+                    return item_data
+                item_content = self._page_html()
                 reviews = self.scrape_paginated_reviews_from_item(item_content, review_limit=review_limit,
-                                                                  item_id=item_data["item_id"])
+                                                                  item_id=item_data.item_id,
+                                                                  last_seen_timestamp=last_seen_timestamp)
                 if reviews:
-                    item_data["reviews"] = reviews
+                    item_data.reviews = reviews
             except WebDriverException as err:
                 self.logger.error(err)
         return item_data
 
-    def retrieve_source_from_url(self, url):
+    def retrieve_source_from_url(self, url, needs_js=True):
         """
-        Method that wraps around a selenium webdriver in order to retrieve the page source from a given URL.
+        Method that retrieves the page source from a given URL, through the selenium webdriver when
+        the page needs JavaScript (or later driver interaction such as the review sort click), and
+        over the shared HTTP session otherwise — a plain GET skips the whole browser round trip.
         :param url: The URL to retrieve the page source from.
+        :param needs_js: Whether the page must be loaded in the browser.
         :return: The given page source content that was retrieved from the URL.
         """
-        try:
-            self.driver.get(url)
-        except TimeoutException as e:
-            self.logger.error(e.msg)
-            return None
-
-        content = self.driver.page_source
+        if needs_js:
+            try:
+                self.driver.get(url)
+            except TimeoutException as e:
+                self.logger.error(e.msg)
+                return None
+            content = self._page_html()
+        else:
+            # Only the static path is cached: a cached browser page would leave the driver off the
+            # page that later review interaction expects it to be on.
+            content = self._read_cached_source(url)
+            if content:
+                return content
+            try:
+                response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+                response.raise_for_status()
+            except RequestException as e:
+                self.logger.error(str(e))
+                return None
+            content = response.text
+            if content:
+                self._write_cached_source(url, content)
 
         if not content:
             self.logger.error("Content could not be retrieved.")
@@ -172,6 +512,48 @@ class GearbestScraper:
 
         return content
 
+    @staticmethod
+    def _cache_path(url):
+        """
+        Builds the on-disk cache path for a URL's page source.
+        :param url: The URL the cache entry belongs to.
+        :return: The path of the cache file for that URL.
+        """
+        return os.path.join(SCRAPER_CACHE_DIR, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".html")
+
+    def _read_cached_source(self, url):
+        """
+        Reads the cached page source for a URL if a fresh enough entry exists.
+        :param url: The URL to look up.
+        :return: The cached page source, or None when the cache is disabled, missing or stale.
+        """
+        if self.disable_cache:
+            return None
+        cache_path = GearbestScraper._cache_path(url)
+        try:
+            if time.time() - os.path.getmtime(cache_path) > CACHE_TTL_SECONDS:
+                return None
+            with open(cache_path, encoding="utf-8") as cache_file:
+                return cache_file.read()
+        except OSError:
+            return None
+
+    def _write_cached_source(self, url, content):
+        """
+        Stores a URL's page source on disk for later runs. Cache failures only cost the cache, so
+        they are logged and swallowed.
+        :param url: The URL the page source was fetched from.
+        :param content: The page source to store.
+        """
+        if self.disable_cache:
+            return
+        try:
+            os.makedirs(SCRAPER_CACHE_DIR, exist_ok=True)
+            with open(GearbestScraper._cache_path(url), "w", encoding="utf-8") as cache_file:
+                cache_file.write(content)
+        except OSError as e:
+            self.logger.debug("Could not cache %s: %s" % (url, e))
+
     def scrape_reviews_from_item(self, content=None, url=None):
         """
         Method that takes care of scraping the reviews from a given item. If there's no content as a parameter, the item page
@@ -182,13 +564,16 @@ class GearbestScraper:
         """
         if not content:
             if url:
-                content = self.retrieve_source_from_url(url)
+                # The first review page is part of the server-rendered item HTML, so no driver is
+                # needed for a single-page review scrape.
+                content = self.retrieve_source_from_url(url, needs_js=False)
             else:
                 return None
 
         return GearbestParser.retrieve_reviews_from_item(content)
 
-    def scrape_paginated_reviews_from_item(self, content=None, url=None, review_limit=math.inf, item_id=None):
+    def scrape_paginated_reviews_from_item(self, content=None, url=None, review_limit=math.inf, item_id=None,
+                                           last_seen_timestamp=_TIMESTAMP_UNKNOWN):
         """
         Wrapper function that scrapes paginated reviews from the item. It scrapes as many as review_limit defines, if the
         page source is None, it will retrieve it from the URL if it exists, if none exist, None is returned.
@@ -197,49 +582,111 @@ class GearbestScraper:
         :param url: The URL of the site in case the content is None.
         :param review_limit: The maximum amount of review pages to scrape for the item.
         :param item_id: The ID of the item in order to get the last review and avoid re-scraping.
+        :param last_seen_timestamp: Optionally, the item's already-looked-up last seen review
+        timestamp; left unset, it's queried here.
         :return: A list containing all reviews of the given item .
         """
         if not content:
             if url:
                 raw_content = self.retrieve_source_from_url(url)
                 try:
-                    self.driver.find_element_by_xpath(REVIEW_MOST_RECENT_XPATH).click()
-                    content = self.driver.page_source
+                    if self.driver.execute_script(JS_CLICK_SELECTOR, REVIEW_MOST_RECENT_CSS):
+                        content = self._page_html()
+                    else:
+                        content = raw_content
                 except WebDriverException:
                     content = raw_content
             else:
                 return None
 
+        if last_seen_timestamp is _TIMESTAMP_UNKNOWN:
+            last_seen_timestamp = self.retrieve_last_seen_timestamp(item_id)
+
+        if last_seen_timestamp:
+            # Incremental scrapes keep the one-click-at-a-time walk, since they usually stop at the
+            # first already-seen review and bulk collection would render pages of old reviews.
+            return self._scrape_review_deltas_paginated(content, review_limit, last_seen_timestamp)
+
+        all_reviews, has_next_page = GearbestParser.parse_review_page(content)
+        if not all_reviews:
+            return []
+        if review_limit <= 1 or not has_next_page:
+            return all_reviews
+
+        # Full scrapes collect every remaining page in one in-page script run instead of a
+        # click / read page HTML / parse round trip per page.
+        for fragment in self._collect_review_pages(review_limit - 1):
+            fragment_reviews = GearbestParser.retrieve_reviews_from_item(fragment)
+            if not fragment_reviews:
+                break
+            all_reviews.extend(fragment_reviews)
+        return all_reviews
+
+    def _scrape_review_deltas_paginated(self, content, review_limit, last_seen_timestamp):
+        """
+        Incremental review path: pages are walked one pagination click at a time, so the crawl stops
+        at the first already-seen review instead of rendering pages of reviews it will discard.
+        :param content: The page source holding the first review page.
+        :param review_limit: The maximum amount of review pages to scrape for the item.
+        :param last_seen_timestamp: The item's last seen review timestamp.
+        :return: A list containing the item's unseen reviews.
+        """
         all_reviews = []
         review_count = 0
-        last_seen_timestamp = self.retrieve_last_seen_timestamp(item_id)
-
         while review_count < review_limit:
-            page_reviews = GearbestParser.retrieve_reviews_from_item(content)
-
-            if page_reviews:
-                if last_seen_timestamp:
-                    new_reviews = self._retrieve_review_deltas(page_reviews, last_seen_timestamp)
-                    if len(new_reviews) == 0:
-                        return all_reviews
-                    all_reviews.extend(new_reviews)
-                else:
-                    all_reviews.extend(page_reviews)
-            else:
-                return all_reviews
+            # One soup serves both the page's reviews and the next-page check.
+            page_reviews, has_next_page = GearbestParser.parse_review_page(content)
 
-            next_page_element = GearbestParser.retrieve_new_review_page_element(content)
+            if not page_reviews:
+                return all_reviews
+            new_reviews = self._retrieve_review_deltas(page_reviews, last_seen_timestamp)
+            if len(new_reviews) == 0:
+                return all_reviews
+            all_reviews.extend(new_reviews)
+            # An already-seen review on this page means every following page is older still,
+            # so the remaining pagination clicks are skipped entirely.
+            if len(new_reviews) < len(page_reviews):
+                return all_reviews
 
-            if not next_page_element:
+            if not has_next_page:
                 return all_reviews
             try:
-                self.driver.find_element_by_xpath(REVIEW_NEXT_XPATH).click()
+                if not self.driver.execute_script(JS_CLICK_SELECTOR, REVIEW_NEXT_CSS):
+                    return all_reviews
             except WebDriverException:
                 return all_reviews
-            content = self.driver.page_source
+            content = self._page_html()
             review_count += 1
         return all_reviews
 
+    def _collect_review_pages(self, page_limit):
+        """
+        Collects the remaining review pages through a single asynchronous in-page script (see
+        JS_COLLECT_REVIEW_PAGES) and returns them as parseable HTML fragments. On any driver
+        failure the pages gathered are simply absent, and the caller keeps what it already has.
+        :param page_limit: The maximum amount of further pages to collect.
+        :return: A list of HTML fragments, one per collected review page.
+        """
+        limit = -1 if page_limit == math.inf else int(page_limit)
+        try:
+            self.driver.set_script_timeout(REVIEW_COLLECT_SCRIPT_TIMEOUT)
+            return self.driver.execute_async_script(JS_COLLECT_REVIEW_PAGES,
+                                                    limit, REVIEW_NEXT_CSS, REVIEW_ITEM_CSS) or []
+        except (TimeoutException, WebDriverException) as err:
+            self.logger.warning("In-page review collection failed, keeping the first page only: %s" % err)
+            return []
+
+    def _get_sql_mgr(self):
+        """
+        Opens the scraper-lifetime MySQL manager on first use and reuses it afterwards, so item
+        lookups stop paying a connection handshake each.
+        :return: An already-open GearbestMySQLManager.
+        """
+        if self._sql_mgr is None:
+            self._sql_mgr = GearbestMySQLManager(DATABASE_NAME)
+            self._sql_mgr.__enter__()
+        return self._sql_mgr
+
     def retrieve_last_seen_timestamp(self, item_id):
         """
         Retrieves the last seen timestamp for that specific item id.
@@ -247,10 +694,32 @@ class GearbestScraper:
         :return: A datetime that represents the last seen review.
         """
         max_timestamp_query = "SELECT max(post_timestamp) as max_timestamp FROM reviews WHERE item_id = %s"
-        with GearbestMySQLManager(DATABASE_NAME) as sql_mgr:
+        with self._sql_lock:
+            sql_mgr = self._get_sql_mgr()
             cur = sql_mgr.execute_selection_query(max_timestamp_query, [item_id])
             res = cur.fetchone().get("max_timestamp")
-            return res if res else None
+            sql_mgr.release_selection_cursor(cur)
+        return res if res else None
+
+    def retrieve_last_seen_timestamps(self, item_ids):
+        """
+        Retrieves the last seen review timestamps for a whole page's worth of item ids in one query,
+        instead of one round trip per item.
+        :param item_ids: The item ids to look up.
+        :return: A dictionary mapping each item id that has seen reviews to its newest timestamp.
+        """
+        if not item_ids:
+            return {}
+        max_timestamps_query = ("SELECT item_id, max(post_timestamp) as max_timestamp FROM reviews "
+                                "WHERE item_id IN (%s) GROUP BY item_id" % ", ".join(["%s"] * len(item_ids)))
+        with self._sql_lock:
+            sql_mgr = self._get_sql_mgr()
+            cur = sql_mgr.execute_selection_query(max_timestamps_query, list(item_ids))
+            timestamps = {row["item_id"]: row["max_timestamp"] for row in cur}
+            sql_mgr.release_selection_cursor(cur)
+        return timestamps
 
     def _retrieve_review_deltas(self, reviews, last_seen_timestamp):
-        return [page_review for page_review in reviews if page_review["post_timestamp"] > last_seen_timestamp]
+        # Reviews are sorted by newest, so the first already-seen review means the rest of the page
+        # is older; takewhile stops scanning there instead of filtering the whole list.
+        return list(takewhile(lambda review: review.post_timestamp > last_seen_timestamp, reviews))
@@ -6,6 +6,9 @@ Main file
 
 import logging
 import os
+import queue
+import subprocess
+import threading
 import traceback
 from datetime import datetime
 
@@ -16,6 +19,11 @@ from database_classes.gearbest_query_manager import GearbestQueryManager
 from gearbest_scraping.gearbest_scraper import GearbestScraper
 
 FILE_PLACEHOLDER = "%s.csv"
+DEFAULT_DRIVER_PORT = 9515
+# How many items to buffer before writing them to MySQL in one bulk transaction.
+UPLOAD_BATCH_SIZE = 500
+# How many full batches may wait on the background writer before scraping blocks.
+WRITE_QUEUE_MAXSIZE = 4
 scraping_date = datetime.now().strftime("%Y_%m_%d|%H_%M_%S")
 
 WORKING_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -38,17 +46,48 @@ logger.addHandler(fh)
 
 def upload_item_to_database(all_departments):
     """
-    Helper function that reunites all scraped data and writes it to a CSV file.
+    Helper function that reunites all scraped data and writes it to the database in bulk batches.
+    Full batches are handed to a background writer thread over a bounded queue, so MySQL commits
+    overlap with the next items being scraped instead of stalling the scraper between yields.
     :param all_departments: The scraped data from Gearbest.
     """
-    for catalog in all_departments:
-        for item in catalog:
-            if item:
-                try:
-                    item_data = DataParser.create_item_data(item)
-                    GearbestQueryManager.add_product(item_data)
-                except Exception as err:
-                    logger.error(str(err) + traceback.format_exc())
+    write_queue = queue.Queue(maxsize=WRITE_QUEUE_MAXSIZE)
+    writer = threading.Thread(target=database_writer, args=(write_queue,))
+    writer.start()
+    try:
+        buffered_items = []
+        for catalog in all_departments:
+            for item in catalog:
+                if item:
+                    try:
+                        buffered_items.append(DataParser.create_item_data(item))
+                    except Exception as err:
+                        logger.error(str(err) + traceback.format_exc())
+                        continue
+                    if len(buffered_items) >= UPLOAD_BATCH_SIZE:
+                        write_queue.put(buffered_items)
+                        buffered_items = []
+        if buffered_items:
+            write_queue.put(buffered_items)
+    finally:
+        write_queue.put(None)
+        writer.join()
+
+
+def database_writer(write_queue):
+    """
+    Background writer loop: drains item batches off the queue and bulk-inserts each one, logging
+    failures per batch. A None entry marks the end of the scrape and stops the loop.
+    :param write_queue: The bounded queue the scraping side fills with item batches.
+    """
+    while True:
+        batch = write_queue.get()
+        if batch is None:
+            return
+        try:
+            GearbestQueryManager.add_products_bulk(batch)
+        except Exception as err:
+            logger.error(str(err) + traceback.format_exc())
 
 
 @click.group()
@@ -108,14 +147,17 @@ def scrape_catalog(url, maxproducts, reviewlimit, sortnewest):
 @click.option('--scrapereviews', default=True,
               help="Flag that indicates whether to scrape reviews from an item or not.")
 @click.option('--reviewlimit', default=10, help="Maximum amount of review pages to scrape from each product page.")
-def scrape_item(url, scrapereviews, reviewlimit):
+@click.option('--remote', default=None,
+              help="URL of a running Chromedriver server (see scrape-daemon) to reuse instead of launching one.")
+def scrape_item(url, scrapereviews, reviewlimit, remote):
     """
     Scrapes an item from Gearbest from the given URL.
     :param url: The catalog URL.
     :param maxproducts: The maximum amount of products to scrape per department.
     :param reviewlimit: The maximum amount of review pages to scrape per product.
+    :param remote: The URL of a long-lived Chromedriver server to connect to, if any.
     """
-    with GearbestScraper() as scraper:
+    with GearbestScraper(remote_url=remote) as scraper:
         try:
             item_data = scraper.scrape_item(url, scrapereviews, reviewlimit)
             upload_item_to_database([[item_data]])
@@ -123,6 +165,18 @@ def scrape_item(url, scrapereviews, reviewlimit):
             logger.error(str(err) + traceback.format_exc())
 
 
+@click.command(help="Runs a long-lived Chromedriver server that scrape commands can reuse via --remote.")
+@click.option('--port', default=DEFAULT_DRIVER_PORT, help="Port for the Chromedriver server to listen on.")
+def scrape_daemon(port):
+    """
+    Keeps a Chromedriver server running so repeated scrape invocations skip the driver launch cost by
+    connecting with --remote http://localhost:<port>. Runs until interrupted.
+    :param port: The port for the server to listen on.
+    """
+    logger.info("Starting Chromedriver server on port %s. Stop it with Ctrl+C." % port)
+    subprocess.run(["chromedriver", "--port=%s" % port])
+
+
 def main_db():
     from database_classes.gearbest_mysql_manager import GearbestMySQLManager
     with GearbestMySQLManager() as mgr:
@@ -135,5 +189,6 @@ if __name__ == "__main__":
     cli.add_command(scrape_gearbest)
     cli.add_command(scrape_catalog)
     cli.add_command(scrape_item)
+    cli.add_command(scrape_daemon)
     logger.info("### LOGGER FOR {} ###".format(scraping_date))
     cli()
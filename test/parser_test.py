@@ -9,6 +9,7 @@ from unittest.mock import MagicMock
 import pytest
 from bs4 import Tag
 
+from data_classes.parsed_item import ParsedItem
 from gearbest_scraping.gearbest_parser import GearbestParser
 
 
@@ -31,11 +32,31 @@ def test_gearbest_price_parsing(test_input, locale, expected):
 
 
 @pytest.mark.parametrize("test_input,expected", [
-    (generate_get_text_mock("$267.83"), {"price": 267.83, "currency_type": "$"}),
-    (generate_get_text_mock("268.83"), {"price": 268.83, "currency_type": "$"}),
-    (None, {})
+    (generate_get_text_mock("$267.83"), (267.83, "$")),
+    (generate_get_text_mock("268.83"), (268.83, "$")),
+    (None, (None, None))
 ])
 def test_gearbest_parse_price_element(test_input, expected):
-    item_dict = {}
-    GearbestParser._parse_price_element(test_input, item_dict)
-    assert item_dict == expected
\ No newline at end of file
+    item = ParsedItem()
+    GearbestParser._parse_price_element(test_input, item)
+    assert (item.price, item.currency_type) == expected
+
+
+# The shape of the fragments JS_COLLECT_REVIEW_PAGES hands back from the in-page review
+# collection: the captured review items wrapped in the js-reviewWrap container the parser expects.
+COLLECTED_REVIEW_FRAGMENT = (
+    '<div id="js-reviewWrap"><ul>'
+    '<li class="goodsReviews_item" data-review-id="42">'
+    '<strong class="goodsReviews_itemUserName">Jane</strong>'
+    '<strong class="goodsReviews_itemTitleText">Great product</strong>'
+    '</li>'
+    '</ul></div>'
+)
+
+
+def test_gearbest_retrieve_reviews_from_collected_fragment():
+    reviews = GearbestParser.retrieve_reviews_from_item(COLLECTED_REVIEW_FRAGMENT)
+    assert len(reviews) == 1
+    assert reviews[0].user_name == "Jane"
+    assert reviews[0].user_id == "42"
+    assert reviews[0].review_title == "Great product"
\ No newline at end of file